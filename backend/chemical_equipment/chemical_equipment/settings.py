@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 import dj_database_url
 
@@ -11,7 +12,8 @@ SECRET_KEY = os.environ.get(
 
 DEBUG = os.environ.get("DEBUG", "False") == "True"
 
-ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "").split(" ")
+# Comma- or space-separated list; empty entries are dropped
+ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "").replace(",", " ").split()
 
 INSTALLED_APPS = [
     "django.contrib.admin",
@@ -22,6 +24,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
 
     "rest_framework",
+    "rest_framework.authtoken",
     "corsheaders",
 
     "equipment",
@@ -29,6 +32,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "equipment.middleware.CompressJSONGZipMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
 
     "corsheaders.middleware.CorsMiddleware",
@@ -69,10 +74,57 @@ WSGI_APPLICATION = "chemical_equipment.wsgi.application"
 DATABASES = {
     "default": dj_database_url.config(
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
-        conn_max_age=600,
+        conn_max_age=None,
+        conn_health_checks=True,
     )
 }
 
+# SQLite fallback: WAL lets readers proceed during bulk CSV imports
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+    DATABASES["default"].setdefault("OPTIONS", {}).update({
+        "init_command": (
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA mmap_size=268435456;"
+        ),
+        "transaction_mode": "IMMEDIATE",
+    })
+
+# PgBouncer in transaction mode cannot hold server-side cursors open
+if os.environ.get("DB_PGBOUNCER", "False") == "True":
+    DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Rows per INSERT when storing uploaded equipment records
+EQUIPMENT_BULK_CREATE_BATCH_SIZE = int(
+    os.environ.get("EQUIPMENT_BULK_CREATE_BATCH_SIZE", "1000")
+)
+
+# =========================
+# CACHES
+# =========================
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Rendered PDF reports are too large for memcached-style backends
+    "reports": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get(
+            "REPORT_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "chemflow_reports"),
+        ),
+    },
+    # Cleaned DataFrames of recent uploads; each entry can be several MB and
+    # lives in every worker process, so only a few are kept, briefly
+    "csv_frames": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "csv-frames",
+        "OPTIONS": {"MAX_ENTRIES": 4},
+    },
+}
+
 # =========================
 # PASSWORD VALIDATION
 # =========================
@@ -100,15 +152,36 @@ USE_TZ = True
 STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic writes hashed, pre-compressed (gzip + brotli) copies
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # =========================
 # CORS & CSRF (IMPORTANT)
 # =========================
 
-CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOW_CREDENTIALS = True
 
+CORS_ALLOWED_ORIGINS = os.environ.get("CORS_ALLOWED_ORIGINS", "").replace(",", " ").split()
+CORS_ALLOWED_ORIGIN_REGEXES = [
+    r"^https://.*\.netlify\.app$",
+]
+
+if DEBUG:
+    CORS_ALLOWED_ORIGINS += [
+        "http://localhost:3000",
+        "http://127.0.0.1:3000",
+    ]
+
 CSRF_TRUSTED_ORIGINS = [
     "https://*.netlify.app",
 ]
@@ -119,7 +192,8 @@ CSRF_TRUSTED_ORIGINS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.BasicAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.TokenAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
@@ -130,5 +204,14 @@ REST_FRAMEWORK = {
 # FILE UPLOAD LIMITS
 # =========================
 
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024
+# Uploaded CSVs are always spooled to a temporary file instead of memory
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
+
+# Background uploads are copied here until their processing thread finishes
+PENDING_UPLOAD_DIR = os.environ.get(
+    "PENDING_UPLOAD_DIR",
+    os.path.join(tempfile.gettempdir(), "chemflow_uploads"),
+)
@@ -3,25 +3,73 @@ Django Admin configuration for equipment app
 """
 
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import Dataset, Equipment
+from .constants import ADMIN_ESTIMATED_COUNT_THRESHOLD
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL planner statistics for unfiltered counts.
+    
+    A full COUNT(*) on a large table is a sequential scan, so once the table
+    grows past ADMIN_ESTIMATED_COUNT_THRESHOLD rows the estimate from
+    pg_class.reltuples is used instead. Filtered querysets and other
+    database backends fall back to the exact count.
+    """
+    
+    @cached_property
+    def count(self) -> int:
+        """Return the estimated or exact number of objects"""
+        queryset = self.object_list
+        if not hasattr(queryset, 'query') or queryset.query.where:
+            return super().count
+        
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        
+        estimate = row[0] if row else 0
+        if estimate < ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return super().count
+        return estimate
 
 
 @admin.register(Dataset)
 class DatasetAdmin(admin.ModelAdmin):
     """Admin configuration for Dataset model"""
     
-    list_display = ('filename', 'uploaded_at', 'total_records', 'user')
-    list_filter = ('uploaded_at', 'total_records')
+    list_display = ('filename', 'uploaded_at', 'total_records', 'status', 'user')
+    list_filter = ('status', 'uploaded_at', 'total_records')
     search_fields = ('filename', 'user__username')
-    readonly_fields = ('uploaded_at', 'summary_data')
+    list_select_related = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    readonly_fields = ('uploaded_at', 'summary_data', 'extended_summary')
     fieldsets = (
         ('Basic Information', {
-            'fields': ('filename', 'user', 'uploaded_at')
+            'fields': ('filename', 'user', 'uploaded_at', 'status', 'status_message')
         }),
         ('Statistics', {
-            'fields': ('total_records', 'summary_data')
+            'fields': ('total_records', 'summary_data', 'extended_summary')
         }),
     )
+    
+    def get_queryset(self, request):
+        """Load only the columns rendered by the changelist"""
+        queryset = super().get_queryset(request).select_related('user')
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            queryset = queryset.only('id', 'filename', 'uploaded_at', 'total_records', 'status', 'user__username')
+        return queryset
 
 
 @admin.register(Equipment)
@@ -31,7 +79,8 @@ class EquipmentAdmin(admin.ModelAdmin):
     list_display = ('equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature')
     list_filter = ('equipment_type', 'dataset__uploaded_at')
     search_fields = ('equipment_name', 'equipment_type', 'dataset__filename')
-    raw_id_fields = ('dataset',)
+    list_select_related = ('dataset',)
+    autocomplete_fields = ('dataset',)
     
     fieldsets = (
         ('Equipment Information', {
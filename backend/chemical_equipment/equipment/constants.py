@@ -3,10 +3,30 @@ Constants and configuration for the equipment app
 """
 
 # CSV VALIDATION CONSTANTS
-REQUIRED_CSV_COLUMNS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
-ALLOWED_FILE_EXTENSIONS = ['.csv']
+REQUIRED_CSV_COLUMNS = ('Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature')
+REQUIRED_CSV_COLUMNS_SET = frozenset(REQUIRED_CSV_COLUMNS)
+ALLOWED_FILE_EXTENSIONS = frozenset({'.csv'})
 MAX_FILE_SIZE_MB = 10
+# Uploads above this size may be processed in the background (Prefer: respond-async)
+LARGE_UPLOAD_THRESHOLD_MB = 5
+# Background uploads processed at once per worker process; more are queued
+BACKGROUND_UPLOAD_WORKERS = 2
+# Uploads still PROCESSING after this long are presumed lost (worker restart)
+PROCESSING_TIMEOUT_MINUTES = 30
 MAX_DATASETS_HISTORY = 5
+BULK_CREATE_BATCH_SIZE = 1000
+# Uploads larger than this use PostgreSQL COPY instead of bulk_create
+COPY_THRESHOLD_ROWS = 5000
+# Rows fetched per round trip when streaming equipment records
+EQUIPMENT_ITERATOR_CHUNK_SIZE = 2000
+
+# CACHE CONFIGURATION (seconds)
+SUMMARY_CACHE_TIMEOUT = 3600
+PDF_CACHE_TIMEOUT = 86400
+CSV_PARSE_CACHE_TIMEOUT = 300
+
+# ADMIN CONFIGURATION
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 100000
 
 # ERROR MESSAGES
 ERROR_MESSAGES = {
@@ -20,7 +40,7 @@ ERROR_MESSAGES = {
 }
 
 # ANALYSIS METRICS
-ANALYSIS_METRICS = {
+ANALYSIS_METRICS = frozenset({
     'total_count',
     'avg_flowrate',
     'avg_pressure',
@@ -32,7 +52,7 @@ ANALYSIS_METRICS = {
     'min_temperature',
     'max_temperature',
     'type_distribution',
-}
+})
 
 # API RESPONSE CODES
 RESPONSE_CODES = {
@@ -60,4 +80,8 @@ PDF_CONFIG = {
 }
 
 # NUMERIC FIELD VALIDATION
-NUMERIC_FIELDS = ['Flowrate', 'Pressure', 'Temperature']
+NUMERIC_FIELDS = ('Flowrate', 'Pressure', 'Temperature')
+NUMERIC_FIELDS_SET = frozenset(NUMERIC_FIELDS)
+NON_NEGATIVE_FIELDS = ('Flowrate', 'Pressure')
+# Offending CSV lines listed in a validation error before the rest are summarized
+MAX_REPORTED_INVALID_ROWS = 10
@@ -0,0 +1,21 @@
+"""
+Custom model fields for the equipment app
+"""
+
+from django.db import models
+
+
+class Float32Field(models.FloatField):
+    """
+    Single-precision float field.
+    
+    Stored as PostgreSQL ``real`` (4 bytes) instead of ``double precision``,
+    halving the width of the numeric columns scanned by aggregates. Other
+    backends keep their default float type.
+    """
+    
+    def db_type(self, connection) -> str:
+        """Return the column type for the given database connection"""
+        if connection.vendor == 'postgresql':
+            return 'real'
+        return super().db_type(connection)
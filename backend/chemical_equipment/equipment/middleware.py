@@ -0,0 +1,19 @@
+"""
+Middleware for the equipment app
+"""
+
+from django.middleware.gzip import GZipMiddleware
+
+
+class CompressJSONGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves PDF reports alone
+    
+    PDFs are already deflate-compressed, so gzipping them only costs CPU,
+    and it drops the Content-Length clients use for download progress.
+    """
+    
+    def process_response(self, request, response):
+        if response.get('Content-Type', '').startswith('application/pdf'):
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,48 @@
+import json
+
+from django.db import migrations, models
+
+
+def copy_summary_to_json(apps, schema_editor):
+    """Parse legacy JSON strings into the new JSONField column"""
+    Dataset = apps.get_model("equipment", "Dataset")
+    for dataset in Dataset.objects.only("id", "summary_data").iterator():
+        try:
+            summary = json.loads(dataset.summary_data) if dataset.summary_data.strip() else {}
+        except (json.JSONDecodeError, ValueError):
+            summary = {}
+        Dataset.objects.filter(pk=dataset.pk).update(summary_json=summary)
+
+
+def copy_json_to_summary(apps, schema_editor):
+    """Serialize JSONField values back into the legacy text column"""
+    Dataset = apps.get_model("equipment", "Dataset")
+    for dataset in Dataset.objects.only("id", "summary_json").iterator():
+        Dataset.objects.filter(pk=dataset.pk).update(
+            summary_data=json.dumps(dataset.summary_json or {})
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0004_alter_dataset_options_alter_equipment_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="summary_json",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(copy_summary_to_json, copy_json_to_summary),
+        migrations.RemoveField(
+            model_name="dataset",
+            name="summary_data",
+        ),
+        migrations.RenameField(
+            model_name="dataset",
+            old_name="summary_json",
+            new_name="summary_data",
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0005_dataset_summary_data_jsonfield"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="equipment",
+            index=models.Index(
+                fields=["dataset", "flowrate", "pressure", "temperature"],
+                name="equip_ds_metrics_idx",
+            ),
+        ),
+    ]
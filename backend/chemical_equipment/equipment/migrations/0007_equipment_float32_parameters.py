@@ -0,0 +1,33 @@
+import django.core.validators
+from django.db import migrations
+
+import equipment.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0006_equipment_equip_ds_metrics_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="equipment",
+            name="flowrate",
+            field=equipment.fields.Float32Field(
+                validators=[django.core.validators.MinValueValidator(0)]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="equipment",
+            name="pressure",
+            field=equipment.fields.Float32Field(
+                validators=[django.core.validators.MinValueValidator(0)]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="equipment",
+            name="temperature",
+            field=equipment.fields.Float32Field(),
+        ),
+    ]
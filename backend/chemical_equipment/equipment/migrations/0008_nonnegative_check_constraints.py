@@ -0,0 +1,52 @@
+from django.db import migrations, models
+
+
+def check_no_negative_rows(apps, schema_editor):
+    """Stop before adding the constraints if existing rows would violate them"""
+    Dataset = apps.get_model("equipment", "Dataset")
+    Equipment = apps.get_model("equipment", "Equipment")
+    dataset_ids = sorted(set(
+        Equipment.objects.filter(models.Q(flowrate__lt=0) | models.Q(pressure__lt=0))
+        .values_list("dataset_id", flat=True)
+    ) | set(
+        Dataset.objects.filter(total_records__lt=0).values_list("id", flat=True)
+    ))
+    if dataset_ids:
+        raise RuntimeError(
+            "Datasets with negative flowrate, pressure or total_records must be "
+            "fixed or deleted before this migration can add its CHECK constraints: "
+            + ", ".join(map(str, dataset_ids))
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0007_equipment_float32_parameters"),
+    ]
+
+    operations = [
+        # Nothing is changed, so there is nothing to undo on the way back
+        migrations.RunPython(check_no_negative_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="dataset",
+            constraint=models.CheckConstraint(
+                condition=models.Q(total_records__gte=0),
+                name="dataset_total_records_nonneg",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="equipment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(flowrate__gte=0),
+                name="equip_flowrate_nonneg",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="equipment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(pressure__gte=0),
+                name="equip_pressure_nonneg",
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0008_nonnegative_check_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="extended_summary",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
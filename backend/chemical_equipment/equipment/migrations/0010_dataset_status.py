@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("equipment", "0009_dataset_extended_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataset",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("processing", "Processing"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="ready",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="dataset",
+            name="status_message",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+    ]
@@ -2,25 +2,47 @@
 Database models for equipment data management
 """
 
-from django.db import models
+import csv
+import io
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Avg, Count, Max, Min
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.validators import MinValueValidator
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Iterable, List, Tuple
+
+from .constants import BULK_CREATE_BATCH_SIZE, SUMMARY_CACHE_TIMEOUT
+from .fields import Float32Field
 
 
 class Dataset(models.Model):
     """Model to store uploaded CSV datasets with metadata and summary statistics."""
     
+    class Status(models.TextChoices):
+        PROCESSING = 'processing', 'Processing'
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'
+    
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='datasets')
     filename = models.CharField(max_length=255)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     total_records = models.IntegerField(default=0, validators=[MinValueValidator(0)])
-    summary_data = models.TextField(blank=True, default='')
+    summary_data = models.JSONField(blank=True, default=dict)
+    extended_summary = models.JSONField(blank=True, default=dict)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.READY)
+    status_message = models.CharField(max_length=255, blank=True, default='')
     
     class Meta:
         ordering = ['-uploaded_at']
         indexes = [models.Index(fields=['-uploaded_at'])]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(total_records__gte=0),
+                name='dataset_total_records_nonneg'
+            ),
+        ]
         verbose_name = 'Dataset'
         verbose_name_plural = 'Datasets'
         
@@ -28,28 +50,41 @@ class Dataset(models.Model):
         """Return string representation of dataset"""
         return f"{self.filename} - {self.uploaded_at.strftime('%Y-%m-%d %H:%M')}"
     
+    @property
+    def summary_cache_key(self) -> str:
+        """Cache key for summary data, invalidated by a new upload timestamp"""
+        return f"ds-summary:{self.pk}:{int(self.uploaded_at.timestamp())}"
+    
     def get_summary_data(self) -> Dict[str, Any]:
         """
         Retrieve summary statistics as dictionary.
         
+        When summary_data was deferred, the value is served from the cache
+        and only fetched from the database on a cache miss.
+        
         Returns:
-            Dict[str, Any]: Parsed summary data or empty dict if invalid
+            Dict[str, Any]: Summary data or empty dict if not set
         """
-        try:
-            if self.summary_data and self.summary_data.strip():
-                return json.loads(self.summary_data)
-        except (json.JSONDecodeError, ValueError):
-            pass
-        return {}
+        if 'summary_data' not in self.get_deferred_fields():
+            return self.summary_data or {}
+        
+        summary = cache.get(self.summary_cache_key)
+        if summary is None:
+            self.refresh_from_db(fields=['summary_data'])
+            summary = self.summary_data or {}
+            cache.set(self.summary_cache_key, summary, timeout=SUMMARY_CACHE_TIMEOUT)
+        return summary
     
     def set_summary_data(self, data: Dict[str, Any]) -> None:
         """
-        Store summary statistics as JSON string.
+        Store summary statistics.
         
         Args:
             data: Dictionary containing statistical analysis
         """
-        self.summary_data = json.dumps(data)
+        self.summary_data = data
+        if self.pk is not None and self.uploaded_at is not None:
+            cache.delete(self.summary_cache_key)
 
 
 class Equipment(models.Model):
@@ -58,19 +93,163 @@ class Equipment(models.Model):
     dataset = models.ForeignKey(Dataset, on_delete=models.CASCADE, related_name='equipment_records')
     equipment_name = models.CharField(max_length=255)
     equipment_type = models.CharField(max_length=100)
-    flowrate = models.FloatField(validators=[MinValueValidator(0)])
-    pressure = models.FloatField(validators=[MinValueValidator(0)])
-    temperature = models.FloatField()
+    flowrate = Float32Field(validators=[MinValueValidator(0)])
+    pressure = Float32Field(validators=[MinValueValidator(0)])
+    temperature = Float32Field()
     
     class Meta:
         ordering = ['equipment_name']
         indexes = [
             models.Index(fields=['dataset', 'equipment_name']),
             models.Index(fields=['equipment_type']),
+            models.Index(
+                fields=['dataset', 'flowrate', 'pressure', 'temperature'],
+                name='equip_ds_metrics_idx'
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(flowrate__gte=0), name='equip_flowrate_nonneg'),
+            models.CheckConstraint(condition=models.Q(pressure__gte=0), name='equip_pressure_nonneg'),
         ]
         verbose_name = 'Equipment'
         verbose_name_plural = 'Equipment'
         
     def __str__(self) -> str:
         """Return string representation of equipment"""
-        return f"{self.equipment_name} ({self.equipment_type})"
\ No newline at end of file
+        return f"{self.equipment_name} ({self.equipment_type})"
+    
+    @classmethod
+    def bulk_from_rows(
+        cls,
+        dataset: Dataset,
+        rows: Iterable[Tuple[str, str, float, float, float]]
+    ) -> List['Equipment']:
+        """
+        Create equipment records for a dataset from parsed CSV rows.
+        
+        Args:
+            dataset: Parent dataset for the records
+            rows: Value tuples in REQUIRED_CSV_COLUMNS order
+            
+        Returns:
+            List[Equipment]: Created equipment records
+        """
+        equipment_list = [
+            cls(
+                dataset=dataset,
+                equipment_name=name,
+                equipment_type=equipment_type,
+                flowrate=float(flowrate),
+                pressure=float(pressure),
+                temperature=float(temperature)
+            )
+            for name, equipment_type, flowrate, pressure, temperature in rows
+        ]
+        
+        with transaction.atomic():
+            return cls.objects.bulk_create(
+                equipment_list,
+                batch_size=getattr(settings, 'EQUIPMENT_BULK_CREATE_BATCH_SIZE', BULK_CREATE_BATCH_SIZE)
+            )
+    
+    @classmethod
+    def copy_csv(
+        cls,
+        dataset: Dataset,
+        rows: Iterable[Tuple[str, str, float, float, float]]
+    ) -> Tuple[io.StringIO, int]:
+        """
+        Render equipment rows as the CSV stream fed to COPY by copy_from_rows.
+        
+        Columns are dataset id, name, type, flowrate, pressure, temperature.
+        
+        Args:
+            dataset: Parent dataset for the records
+            rows: Value tuples in REQUIRED_CSV_COLUMNS order
+            
+        Returns:
+            Tuple[io.StringIO, int]: Buffer rewound to the start, and the
+            number of rows written
+        """
+        # Quote text so an empty string is not read back as NULL
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        count = 0
+        for name, equipment_type, flowrate, pressure, temperature in rows:
+            writer.writerow((
+                dataset.pk,
+                name,
+                equipment_type,
+                float(flowrate),
+                float(pressure),
+                float(temperature),
+            ))
+            count += 1
+        buffer.seek(0)
+        return buffer, count
+    
+    @classmethod
+    def copy_from_rows(
+        cls,
+        dataset: Dataset,
+        rows: Iterable[Tuple[str, str, float, float, float]]
+    ) -> int:
+        """
+        Stream equipment records into the table with PostgreSQL COPY.
+        
+        Skips model instances and per-row INSERT overhead entirely; only
+        valid on PostgreSQL connections (psycopg2 copy_expert).
+        
+        Args:
+            dataset: Parent dataset for the records
+            rows: Value tuples in REQUIRED_CSV_COLUMNS order
+            
+        Returns:
+            int: Number of rows written
+        """
+        buffer, count = cls.copy_csv(dataset, rows)
+        
+        quote_name = connection.ops.quote_name
+        columns = ', '.join(
+            quote_name(cls._meta.get_field(field).column)
+            for field in ('dataset', 'equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature')
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {quote_name(cls._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        return count
+    
+    @classmethod
+    def analysis_for(cls, dataset_id: int) -> Dict[str, Any]:
+        """
+        Compute summary statistics for a dataset in the database.
+        
+        Args:
+            dataset_id: ID of the dataset to analyse
+            
+        Returns:
+            Dict[str, Any]: Statistics keyed like ANALYSIS_METRICS
+        """
+        records = cls.objects.filter(dataset_id=dataset_id)
+        statistics = records.aggregate(
+            total_count=Count('id'),
+            avg_flowrate=Avg('flowrate'),
+            min_flowrate=Min('flowrate'),
+            max_flowrate=Max('flowrate'),
+            avg_pressure=Avg('pressure'),
+            min_pressure=Min('pressure'),
+            max_pressure=Max('pressure'),
+            avg_temperature=Avg('temperature'),
+            min_temperature=Min('temperature'),
+            max_temperature=Max('temperature'),
+        )
+        for key, value in statistics.items():
+            if key != 'total_count':
+                statistics[key] = float(value) if value is not None else 0.0
+        
+        statistics['type_distribution'] = dict(
+            records.values_list('equipment_type').annotate(count=Count('id')).order_by()
+        )
+        return statistics
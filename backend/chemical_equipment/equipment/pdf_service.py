@@ -2,17 +2,22 @@
 PDF Report Generation Service
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+import hashlib
 import io
-import tempfile
-import os
+import json
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
+
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgb
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -22,16 +27,59 @@ from reportlab.platypus import (
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.pdfgen import canvas
+from django.core.cache import caches
 
-from .models import Dataset
+from .models import Dataset, Equipment
+from .services import DatasetService
 from .exceptions import PDFGenerationError
+from .constants import PDF_CACHE_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
 
+class _FigurePool:
+    """Reusable matplotlib figures keyed by size, checked out one render at a time"""
+    
+    MAX_IDLE_PER_SIZE = 4
+    _idle: Dict[Tuple[float, float], List[Figure]] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    @contextmanager
+    def figure(cls, figsize: Tuple[float, float]) -> Iterator[Tuple[Figure, Any]]:
+        """
+        Check out a blank figure with a single Axes.
+        
+        Args:
+            figsize: Figure size in inches
+            
+        Returns:
+            Iterator[Tuple[Figure, Any]]: Context yielding the figure and its Axes
+        """
+        with cls._lock:
+            idle = cls._idle.setdefault(figsize, [])
+            fig = idle.pop() if idle else None
+        if fig is None:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        try:
+            yield fig, fig.add_subplot()
+        finally:
+            fig.clear()
+            with cls._lock:
+                if len(idle) < cls.MAX_IDLE_PER_SIZE:
+                    idle.append(fig)
+
+
 class PDFReportGenerator:
     """Generates comprehensive PDF reports for equipment datasets"""
     
+    # Raster resolution for embedded charts; PDF viewers downsample anyway.
+    # Figure sizes share the aspect ratio of the Image they are placed in and
+    # are saved without a tight bbox (an extra draw pass), so the PNG is only
+    # scaled uniformly, never stretched.
+    CHART_DPI = 96
+    
     # Chart colors palette
     COLORS = ['#818cf8', '#34d399', '#a78bfa', '#fb923c', '#fbbf24', '#38bdf8']
     
@@ -44,6 +92,21 @@ class PDFReportGenerator:
         'bottomMargin': 0.75 * inch,
     }
     
+    # Table geometry; fixed row heights (points) let reportlab skip measuring cells
+    ROW_HEIGHT = 32
+    COMPACT_ROW_HEIGHT = 28
+    INFO_COL_WIDTHS = [2*inch, 4.5*inch]
+    STATS_COL_WIDTHS = [2*inch, 1.5*inch, 1.5*inch, 1.5*inch]
+    TYPE_COL_WIDTHS = [1.8*inch, 0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch]
+    EQUIPMENT_COL_WIDTHS = [2*inch, 1.3*inch, 1.1*inch, 1.1*inch, 1*inch]
+    
+    # Number of records listed in the equipment details table
+    EQUIPMENT_TABLE_ROWS = 20
+    
+    # Numeric columns, in the order they appear in the records array
+    PARAMETERS = ('flowrate', 'pressure', 'temperature')
+    RECORD_DTYPE = np.dtype([('type', object), ('params', np.float32, (len(PARAMETERS),))])
+    
     # Color scheme
     PRIMARY_COLOR = '#10b981'
     SECONDARY_COLOR = '#334155'
@@ -52,6 +115,98 @@ class PDFReportGenerator:
     LIGHT_BG = '#f8fafc'
     BORDER_COLOR = '#e2e8f0'
     
+    # Colors parsed once at class load: reportlab Colors for tables and
+    # RGB tuples for matplotlib
+    PALETTE = {
+        'PRIMARY': colors.HexColor(PRIMARY_COLOR),
+        'SECONDARY': colors.HexColor(SECONDARY_COLOR),
+        'ACCENT_1': colors.HexColor(ACCENT_COLOR_1),
+        'ACCENT_2': colors.HexColor(ACCENT_COLOR_2),
+        'LIGHT_BG': colors.HexColor(LIGHT_BG),
+        'BORDER': colors.HexColor(BORDER_COLOR),
+    }
+    CHART_COLORS = [to_rgb(color) for color in COLORS]
+    MIN_BAR_COLOR = to_rgb(ACCENT_COLOR_1)
+    AVG_BAR_COLOR = to_rgb(PRIMARY_COLOR)
+    MAX_BAR_COLOR = to_rgb(ACCENT_COLOR_2)
+    
+    # Table styles, built once at class load
+    HEADER_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, -1), PALETTE['PRIMARY']),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 20),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    )
+    INFO_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, 0), PALETTE['SECONDARY']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BACKGROUND', (0, 1), (0, -1), PALETTE['LIGHT_BG']),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('TEXTCOLOR', (0, 1), (0, -1), PALETTE['SECONDARY']),
+        ('GRID', (0, 0), (-1, -1), 1, PALETTE['BORDER']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 15),
+    )
+    STATS_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, 0), PALETTE['PRIMARY']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['LIGHT_BG']]),
+        ('GRID', (0, 0), (-1, -1), 1, PALETTE['BORDER']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    )
+    ENHANCED_STATS_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, 0), PALETTE['ACCENT_2']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['LIGHT_BG']]),
+        ('GRID', (0, 0), (-1, -1), 1, PALETTE['BORDER']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    )
+    TYPE_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, 0), PALETTE['SECONDARY']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['LIGHT_BG']]),
+        ('GRID', (0, 0), (-1, -1), 1, PALETTE['BORDER']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    )
+    EQUIPMENT_TABLE_STYLE = (
+        ('BACKGROUND', (0, 0), (-1, 0), PALETTE['SECONDARY']),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['LIGHT_BG']]),
+        ('GRID', (0, 0), (-1, -1), 1, PALETTE['BORDER']),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    )
+    
     def __init__(self, dataset: Dataset):
         """
         Initialize PDF generator with dataset.
@@ -60,19 +215,77 @@ class PDFReportGenerator:
             dataset: Dataset instance to generate report for
         """
         self.dataset = dataset
-        self.summary = dataset.get_summary_data()
-        self.temp_dir = tempfile.mkdtemp()
+        self.summary = dataset.get_summary_data() or Equipment.analysis_for(dataset.id)
         
+        # Section heading styles shared by every section of the report
+        self.styles = getSampleStyleSheet()
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=self.styles['Heading2'],
+            fontSize=16,
+            textColor=self.PALETTE['SECONDARY'],
+            spaceAfter=12,
+            spaceBefore=0,
+            fontName='Helvetica-Bold'
+        )
+        self.spaced_heading_style = ParagraphStyle(
+            'CustomHeadingSpaced',
+            parent=self.heading_style,
+            spaceBefore=12
+        )
+        
+    @cached_property
+    def _records_soa(self) -> Dict[str, np.ndarray]:
+        """
+        Fetch equipment records once as a struct of arrays.
+        
+        Returns:
+            Dict[str, np.ndarray]: 'type' object array plus an (N, 3)
+            'params' array with columns ordered as PARAMETERS
+        """
+        # Row order is irrelevant to the statistics, so no ORDER BY
+        rows = DatasetService.iter_equipment(
+            self.dataset, 'equipment_type', *self.PARAMETERS, ordered=False
+        )
+        # Filled straight from the streamed rows, without an intermediate list.
+        # float32 matches the column storage and halves the array size; the
+        # report only renders two decimals, so the lost precision never shows
+        records = np.fromiter(
+            ((eq_type, values) for eq_type, *values in rows),
+            dtype=self.RECORD_DTYPE
+        )
+        return {
+            'type': records['type'],
+            'params': np.ascontiguousarray(records['params']),
+        }
+    
+    @property
+    def cache_key(self) -> str:
+        """Cache key for the rendered report, tied to the dataset snapshot"""
+        summary_hash = hashlib.blake2b(
+            json.dumps(self.summary, sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+        uploaded = int(self.dataset.uploaded_at.timestamp())
+        return f"pdf:{self.dataset.id}:{uploaded}:{summary_hash}"
+    
     def generate(self) -> io.BytesIO:
         """
         Generate complete PDF report.
         
+        Previously rendered reports are served from the 'reports' cache.
+        
         Returns:
             io.BytesIO: PDF file buffer
             
         Raises:
             PDFGenerationError: If PDF generation fails
         """
+        report_cache = caches['reports']
+        cached = report_cache.get(self.cache_key)
+        if cached is not None:
+            return io.BytesIO(cached)
+        
         try:
             buffer = io.BytesIO()
             doc = SimpleDocTemplate(
@@ -84,7 +297,7 @@ class PDFReportGenerator:
             )
             
             elements = []
-            styles = getSampleStyleSheet()
+            styles = self.styles
             
             # Add sections
             elements.extend(self._create_header(styles))
@@ -99,15 +312,12 @@ class PDFReportGenerator:
             # Build PDF
             doc.build(elements)
             buffer.seek(0)
-            
-            # Cleanup
-            self._cleanup_temp_files()
+            report_cache.set(self.cache_key, buffer.getvalue(), timeout=PDF_CACHE_TIMEOUT)
             
             return buffer
             
         except Exception as e:
             logger.error(f"Error generating PDF: {str(e)}", exc_info=True)
-            self._cleanup_temp_files()
             raise PDFGenerationError(f"Failed to generate PDF: {str(e)}")
     
     def _create_header(self, styles) -> list:
@@ -119,13 +329,7 @@ class PDFReportGenerator:
             )
         ]]
         header_table = Table(header_data, colWidths=[6.5*inch])
-        header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(self.PRIMARY_COLOR)),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ]))
+        header_table.setStyle(TableStyle(self.HEADER_TABLE_STYLE))
         
         return [header_table, Spacer(1, 0.4*inch)]
     
@@ -138,37 +342,17 @@ class PDFReportGenerator:
             ['Total Records:', str(self.dataset.total_records)],
         ]
         
-        info_table = Table(info_data, colWidths=[2*inch, 4.5*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.SECONDARY_COLOR)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor(self.LIGHT_BG)),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor(self.SECONDARY_COLOR)),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(self.BORDER_COLOR)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ]))
+        info_table = Table(
+            info_data,
+            colWidths=self.INFO_COL_WIDTHS,
+            rowHeights=[self.ROW_HEIGHT] * len(info_data)
+        )
+        info_table.setStyle(TableStyle(self.INFO_TABLE_STYLE))
         
         return [info_table, Spacer(1, 0.3*inch)]
     
     def _create_statistics_section(self, styles) -> list:
         """Create statistics table section"""
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor(self.SECONDARY_COLOR),
-            spaceAfter=12,
-            spaceBefore=0,
-            fontName='Helvetica-Bold'
-        )
-        
         stats_data = [
             ['Parameter', 'Minimum', 'Average', 'Maximum'],
             [
@@ -191,68 +375,74 @@ class PDFReportGenerator:
             ],
         ]
         
-        stats_table = Table(stats_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.PRIMARY_COLOR)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.LIGHT_BG)]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(self.BORDER_COLOR)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        stats_table = Table(
+            stats_data,
+            colWidths=self.STATS_COL_WIDTHS,
+            rowHeights=[self.ROW_HEIGHT] * len(stats_data)
+        )
+        stats_table.setStyle(TableStyle(self.STATS_TABLE_STYLE))
         
         return [
-            Paragraph('Summary Statistics', heading_style),
+            Paragraph('Summary Statistics', self.heading_style),
             stats_table,
             Spacer(1, 0.4*inch)
         ]
     
     def _calculate_extended_statistics(self) -> Dict[str, Dict[str, float]]:
         """Calculate extended statistics including median and std deviation"""
-        equipment_records = self.dataset.equipment_records.all()
-        
-        flowrates = []
-        pressures = []
-        temperatures = []
-        
-        for eq in equipment_records:
-            flowrates.append(eq.flowrate)
-            pressures.append(eq.pressure)
-            temperatures.append(eq.temperature)
-        
-        def calc_stats(values):
-            if not values:
-                return {'median': 0, 'std_dev': 0, 'variance': 0}
-            arr = np.array(values)
-            return {
-                'median': float(np.median(arr)),
-                'std_dev': float(np.std(arr)),
-                'variance': float(np.var(arr))
-            }
+        precomputed = self.dataset.extended_summary.get('per_param')
+        if precomputed:
+            return precomputed
+        
+        values = self._records_soa['params']
+        
+        if not len(values):
+            empty = {'median': 0, 'std_dev': 0, 'variance': 0}
+            return {'flowrate': dict(empty), 'pressure': dict(empty), 'temperature': dict(empty)}
+        
+        medians = np.median(values, axis=0)
+        std_devs = values.std(axis=0)
+        variances = values.var(axis=0)
         
         return {
-            'flowrate': calc_stats(flowrates),
-            'pressure': calc_stats(pressures),
-            'temperature': calc_stats(temperatures)
+            param: {
+                'median': float(medians[i]),
+                'std_dev': float(std_devs[i]),
+                'variance': float(variances[i])
+            }
+            for i, param in enumerate(self.PARAMETERS)
         }
     
+    def _calculate_type_breakdown(self) -> List[Dict[str, Any]]:
+        """Calculate per-type counts and parameter averages, sorted by type"""
+        precomputed = self.dataset.extended_summary.get('per_type')
+        if precomputed:
+            return precomputed
+        
+        # Group parameters by type: sorted unique types, then a weighted
+        # bincount per column (a single C loop, unlike np.add.at's scatter)
+        records = self._records_soa
+        types, inverse, counts = np.unique(records['type'], return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        sums = np.column_stack([
+            np.bincount(inverse, weights=records['params'][:, i], minlength=len(types))
+            for i in range(len(self.PARAMETERS))
+        ])
+        means = sums / counts[:, None] if len(types) else sums
+        
+        return [
+            {
+                'equipment_type': eq_type,
+                'count': int(counts[i]),
+                'avg_flowrate': float(means[i, 0]),
+                'avg_pressure': float(means[i, 1]),
+                'avg_temperature': float(means[i, 2]),
+            }
+            for i, eq_type in enumerate(types)
+        ]
+    
     def _create_enhanced_statistics_section(self, styles) -> list:
         """Create enhanced statistics section with median and std deviation"""
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor(self.SECONDARY_COLOR),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
         ext_stats = self._calculate_extended_statistics()
         
         stats_data = [
@@ -277,96 +467,41 @@ class PDFReportGenerator:
             ],
         ]
         
-        stats_table = Table(stats_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.ACCENT_COLOR_2)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.LIGHT_BG)]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(self.BORDER_COLOR)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
+        stats_table = Table(
+            stats_data,
+            colWidths=self.STATS_COL_WIDTHS,
+            rowHeights=[self.ROW_HEIGHT] * len(stats_data)
+        )
+        stats_table.setStyle(TableStyle(self.ENHANCED_STATS_TABLE_STYLE))
         
         return [
-            Paragraph('Advanced Statistics', heading_style),
+            Paragraph('Advanced Statistics', self.spaced_heading_style),
             stats_table,
             Spacer(1, 0.4*inch)
         ]
     
     def _create_equipment_type_breakdown(self, styles) -> list:
         """Create equipment type breakdown section"""
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor(self.SECONDARY_COLOR),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        equipment_records = self.dataset.equipment_records.all()
-        type_distribution = {}
-        type_stats = {}
-        
-        # Group equipment by type and calculate statistics
-        for eq in equipment_records:
-            if eq.equipment_type not in type_distribution:
-                type_distribution[eq.equipment_type] = []
-            type_distribution[eq.equipment_type].append({
-                'flowrate': eq.flowrate,
-                'pressure': eq.pressure,
-                'temperature': eq.temperature
-            })
-        
-        # Calculate averages per type
-        for eq_type, records in type_distribution.items():
-            avg_flowrate = sum(r['flowrate'] for r in records) / len(records)
-            avg_pressure = sum(r['pressure'] for r in records) / len(records)
-            avg_temperature = sum(r['temperature'] for r in records) / len(records)
-            
-            type_stats[eq_type] = {
-                'count': len(records),
-                'avg_flowrate': avg_flowrate,
-                'avg_pressure': avg_pressure,
-                'avg_temperature': avg_temperature
-            }
-        
         # Create table
         type_data = [['Equipment Type', 'Count', 'Avg Flowrate', 'Avg Pressure', 'Avg Temperature']]
-        for eq_type in sorted(type_stats.keys()):
-            stats = type_stats[eq_type]
+        for stats in self._calculate_type_breakdown():
             type_data.append([
-                eq_type,
+                stats['equipment_type'],
                 str(stats['count']),
                 f"{stats['avg_flowrate']:.2f}",
                 f"{stats['avg_pressure']:.2f}",
                 f"{stats['avg_temperature']:.2f}"
             ])
         
-        type_table = Table(type_data, colWidths=[1.8*inch, 0.8*inch, 1.3*inch, 1.3*inch, 1.3*inch])
-        type_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.SECONDARY_COLOR)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.LIGHT_BG)]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(self.BORDER_COLOR)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        type_table = Table(
+            type_data,
+            colWidths=self.TYPE_COL_WIDTHS,
+            rowHeights=[self.COMPACT_ROW_HEIGHT] * len(type_data)
+        )
+        type_table.setStyle(TableStyle(self.TYPE_TABLE_STYLE))
         
         return [
-            Paragraph('Equipment Type Breakdown', heading_style),
+            Paragraph('Equipment Type Breakdown', self.spaced_heading_style),
             type_table,
             Spacer(1, 0.4*inch)
         ]
@@ -379,203 +514,178 @@ class PDFReportGenerator:
         if not type_dist:
             return elements
         
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor(self.SECONDARY_COLOR),
-            spaceAfter=12,
-            spaceBefore=0,
-            fontName='Helvetica-Bold'
-        )
-        
         try:
-            # Bar chart - returns a list, so extend it
-            bar_elements = self._create_bar_chart(heading_style, type_dist)
-            elements.extend(bar_elements)
+            # Charts use independent Figure objects, so they can render concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                chart_futures = [
+                    executor.submit(self._create_bar_chart, type_dist),
+                    executor.submit(self._create_pie_chart, type_dist),
+                    executor.submit(self._create_comparison_chart),
+                ]
             
-            # Pie chart - add page break and pie chart
-            elements.append(PageBreak())
-            pie_elements = self._create_pie_chart(heading_style, type_dist)
-            elements.extend(pie_elements)
-            
-            # Parameter comparison - add page break and comparison chart
-            elements.append(PageBreak())
-            comp_elements = self._create_comparison_chart(heading_style)
-            elements.extend(comp_elements)
+            # Bar, pie and parameter comparison charts, each after a page break
+            for index, future in enumerate(chart_futures):
+                chart_elements = future.result()
+                if index:
+                    elements.append(PageBreak())
+                elements.extend(chart_elements)
         except Exception as e:
             logger.warning(f"Error creating charts: {str(e)}, continuing without charts")
             # Continue with other sections even if charts fail
         
         return elements
     
-    def _create_bar_chart(self, heading_style, type_dist) -> list:
+    def _create_bar_chart(self, type_dist) -> list:
         """Create equipment type distribution bar chart"""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        types = list(type_dist.keys())
-        counts = list(type_dist.values())
-        
-        colors_list = self.COLORS
-        bars = ax.bar(types, counts, color=colors_list[:len(types)], edgecolor='white', linewidth=2)
-        
-        ax.set_xlabel('Equipment Type', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Count', fontsize=12, fontweight='bold')
-        ax.set_title('Equipment Type Distribution', fontsize=14, fontweight='bold', pad=20)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontweight='bold')
-        
-        plt.tight_layout()
-        chart_path = os.path.join(self.temp_dir, 'bar_chart.png')
-        plt.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        with _FigurePool.figure((8, 4)) as (fig, ax):
+            types = list(type_dist.keys())
+            counts = list(type_dist.values())
+            
+            colors_list = self.CHART_COLORS
+            bars = ax.bar(types, counts, color=colors_list[:len(types)], edgecolor='white', linewidth=2)
+            
+            ax.set_xlabel('Equipment Type', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Count', fontsize=12, fontweight='bold')
+            ax.set_title('Equipment Type Distribution', fontsize=14, fontweight='bold', pad=20)
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+            
+            # Add value labels
+            for bar in bars:
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                       f'{int(height)}',
+                       ha='center', va='bottom', fontweight='bold')
+            
+            fig.tight_layout()
+            chart_buffer = io.BytesIO()
+            fig.savefig(chart_buffer, format='png', dpi=self.CHART_DPI, facecolor='white')
+            chart_buffer.seek(0)
         
         return [
-            Paragraph('Equipment Type Distribution', heading_style),
+            Paragraph('Equipment Type Distribution', self.heading_style),
             Spacer(1, 0.1*inch),
-            Image(chart_path, width=6*inch, height=3*inch),
+            Image(chart_buffer, width=6*inch, height=3*inch),
             Spacer(1, 0.3*inch)
         ]
     
-    def _create_pie_chart(self, heading_style, type_dist) -> list:
+    def _create_pie_chart(self, type_dist) -> list:
         """Create type distribution pie chart"""
-        fig, ax = plt.subplots(figsize=(7, 5))
-        types = list(type_dist.keys())
-        counts = list(type_dist.values())
-        colors_list = self.COLORS
-        
-        pie_result = ax.pie(
-            counts,
-            labels=types,
-            autopct='%1.1f%%',
-            colors=colors_list[:len(types)],
-            startangle=90,
-            explode=[0.05] * len(types),
-            shadow=True
-        )
-        
-        wedges, texts, autotexts = pie_result if len(pie_result) == 3 else (pie_result[0], pie_result[1], [])
-        
-        for text in texts:
-            text.set_fontsize(11)
-            text.set_fontweight('bold')
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(10)
-            autotext.set_fontweight('bold')
-        
-        ax.set_title('Type Distribution Breakdown', fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
-        
-        chart_path = os.path.join(self.temp_dir, 'pie_chart.png')
-        plt.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        with _FigurePool.figure((7, 4.9)) as (fig, ax):
+            types = list(type_dist.keys())
+            counts = list(type_dist.values())
+            colors_list = self.CHART_COLORS
+            
+            pie_result = ax.pie(
+                counts,
+                labels=types,
+                autopct='%1.1f%%',
+                colors=colors_list[:len(types)],
+                startangle=90,
+                explode=[0.05] * len(types),
+                shadow=True
+            )
+            
+            wedges, texts, autotexts = pie_result if len(pie_result) == 3 else (pie_result[0], pie_result[1], [])
+            
+            for text in texts:
+                text.set_fontsize(11)
+                text.set_fontweight('bold')
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontsize(10)
+                autotext.set_fontweight('bold')
+            
+            ax.set_title('Type Distribution Breakdown', fontsize=14, fontweight='bold', pad=20)
+            fig.tight_layout()
+            
+            chart_buffer = io.BytesIO()
+            fig.savefig(chart_buffer, format='png', dpi=self.CHART_DPI, facecolor='white')
+            chart_buffer.seek(0)
         
         return [
-            Paragraph('Type Distribution Breakdown', heading_style),
+            Paragraph('Type Distribution Breakdown', self.heading_style),
             Spacer(1, 0.1*inch),
-            Image(chart_path, width=5*inch, height=3.5*inch),
+            Image(chart_buffer, width=5*inch, height=3.5*inch),
             Spacer(1, 0.3*inch)
         ]
     
-    def _create_comparison_chart(self, heading_style) -> list:
+    def _create_comparison_chart(self) -> list:
         """Create parameter comparison chart"""
-        fig, ax = plt.subplots(figsize=(8, 4))
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
-        min_vals = [
-            self.summary.get('min_flowrate', 0),
-            self.summary.get('min_pressure', 0),
-            self.summary.get('min_temperature', 0)
-        ]
-        avg_vals = [
-            self.summary.get('avg_flowrate', 0),
-            self.summary.get('avg_pressure', 0),
-            self.summary.get('avg_temperature', 0)
-        ]
-        max_vals = [
-            self.summary.get('max_flowrate', 0),
-            self.summary.get('max_pressure', 0),
-            self.summary.get('max_temperature', 0)
-        ]
-        
-        x = range(len(parameters))
-        width = 0.25
-        
-        ax.bar([i - width for i in x], min_vals, width, label='Minimum', color=self.ACCENT_COLOR_1)
-        ax.bar(x, avg_vals, width, label='Average', color=self.PRIMARY_COLOR)
-        ax.bar([i + width for i in x], max_vals, width, label='Maximum', color=self.ACCENT_COLOR_2)
-        
-        ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Values', fontsize=12, fontweight='bold')
-        ax.set_title('Parameter Comparison (Min/Avg/Max)', fontsize=14, fontweight='bold', pad=20)
-        ax.set_xticks(x)
-        ax.set_xticklabels(parameters)
-        ax.legend(loc='upper left', framealpha=0.9)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        plt.tight_layout()
-        chart_path = os.path.join(self.temp_dir, 'comparison_chart.png')
-        plt.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        with _FigurePool.figure((8, 4)) as (fig, ax):
+            parameters = ['Flowrate', 'Pressure', 'Temperature']
+            min_vals = [
+                self.summary.get('min_flowrate', 0),
+                self.summary.get('min_pressure', 0),
+                self.summary.get('min_temperature', 0)
+            ]
+            avg_vals = [
+                self.summary.get('avg_flowrate', 0),
+                self.summary.get('avg_pressure', 0),
+                self.summary.get('avg_temperature', 0)
+            ]
+            max_vals = [
+                self.summary.get('max_flowrate', 0),
+                self.summary.get('max_pressure', 0),
+                self.summary.get('max_temperature', 0)
+            ]
+            
+            x = range(len(parameters))
+            width = 0.25
+            
+            ax.bar([i - width for i in x], min_vals, width, label='Minimum', color=self.MIN_BAR_COLOR)
+            ax.bar(x, avg_vals, width, label='Average', color=self.AVG_BAR_COLOR)
+            ax.bar([i + width for i in x], max_vals, width, label='Maximum', color=self.MAX_BAR_COLOR)
+            
+            ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Values', fontsize=12, fontweight='bold')
+            ax.set_title('Parameter Comparison (Min/Avg/Max)', fontsize=14, fontweight='bold', pad=20)
+            ax.set_xticks(x)
+            ax.set_xticklabels(parameters)
+            ax.legend(loc='upper left', framealpha=0.9)
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+            
+            fig.tight_layout()
+            chart_buffer = io.BytesIO()
+            fig.savefig(chart_buffer, format='png', dpi=self.CHART_DPI, facecolor='white')
+            chart_buffer.seek(0)
         
         return [
-            Paragraph('Parameter Comparison Analysis', heading_style),
+            Paragraph('Parameter Comparison Analysis', self.heading_style),
             Spacer(1, 0.1*inch),
-            Image(chart_path, width=6*inch, height=3*inch),
+            Image(chart_buffer, width=6*inch, height=3*inch),
             Spacer(1, 0.3*inch)
         ]
     
     def _create_equipment_table(self, styles) -> list:
         """Create equipment records table"""
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor(self.SECONDARY_COLOR),
-            spaceAfter=12,
-            spaceBefore=0,
-            fontName='Helvetica-Bold'
-        )
-        
-        equipment = self.dataset.equipment_records.all()[:20]
+        rows = self.dataset.equipment_records.values_list(
+            'equipment_name', 'equipment_type', *self.PARAMETERS
+        )[:self.EQUIPMENT_TABLE_ROWS]
         
         eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
-        for eq in equipment:
+        for name, eq_type, flowrate, pressure, temperature in rows:
             eq_data.append([
-                eq.equipment_name[:25],
-                eq.equipment_type,
-                f"{eq.flowrate:.2f}",
-                f"{eq.pressure:.2f}",
-                f"{eq.temperature:.2f}"
+                name[:25],
+                eq_type,
+                f"{flowrate:.2f}",
+                f"{pressure:.2f}",
+                f"{temperature:.2f}"
             ])
         
-        eq_table = Table(eq_data, colWidths=[2*inch, 1.3*inch, 1.1*inch, 1.1*inch, 1*inch])
-        eq_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(self.SECONDARY_COLOR)),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(self.LIGHT_BG)]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor(self.BORDER_COLOR)),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        eq_table = Table(
+            eq_data,
+            colWidths=self.EQUIPMENT_COL_WIDTHS,
+            rowHeights=[self.COMPACT_ROW_HEIGHT] * len(eq_data)
+        )
+        eq_table.setStyle(TableStyle(self.EQUIPMENT_TABLE_STYLE))
         
         return [
             PageBreak(),
-            Paragraph('Equipment Records Details', heading_style),
+            Paragraph('Equipment Records Details', self.heading_style),
             Spacer(1, 0.2*inch),
             eq_table
         ]
@@ -588,14 +698,3 @@ class PDFReportGenerator:
             f'</font></para>'
         )
         return [Spacer(1, 0.5*inch), Paragraph(footer_text, styles['Normal'])]
-    
-    def _cleanup_temp_files(self) -> None:
-        """Clean up temporary chart files"""
-        try:
-            for file in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, file)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            os.rmdir(self.temp_dir)
-        except Exception as e:
-            logger.warning(f"Error cleaning up temp files: {str(e)}")
@@ -3,7 +3,7 @@ DRF Serializers for equipment app
 """
 
 from rest_framework import serializers
-from typing import Dict, Any
+from typing import Dict, Any, List
 from .models import Dataset, Equipment
 
 
@@ -34,7 +34,7 @@ class DatasetDetailSerializer(serializers.ModelSerializer):
     Used when retrieving complete dataset information with all related equipment.
     """
     
-    equipment_records = EquipmentSerializer(many=True, read_only=True)
+    equipment_records = serializers.SerializerMethodField()
     summary = serializers.SerializerMethodField()
     
     class Meta:
@@ -66,6 +66,26 @@ class DatasetDetailSerializer(serializers.ModelSerializer):
             Dict[str, Any]: Parsed summary statistics
         """
         return obj.get_summary_data()
+    
+    def get_equipment_records(self, obj: Dataset) -> List[Dict[str, Any]]:
+        """
+        Get equipment records as plain dictionaries.
+        
+        Uses the records the view prefetched into prefetched_equipment, otherwise
+        projects just the serialized columns in the database. Either way
+        DRF's per-field serializer machinery is skipped.
+        
+        Args:
+            obj: Dataset instance
+            
+        Returns:
+            List[Dict[str, Any]]: Equipment records with EquipmentSerializer fields
+        """
+        fields = EquipmentSerializer.Meta.fields
+        prefetched = getattr(obj, 'prefetched_equipment', None)
+        if prefetched is not None:
+            return [{field: getattr(eq, field) for field in fields} for eq in prefetched]
+        return list(obj.equipment_records.values(*fields))
 
 
 class DatasetListSerializer(serializers.ModelSerializer):
@@ -2,9 +2,22 @@
 Business logic services for equipment data processing
 """
 
-from typing import Dict, Any, List
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, Optional
 import pandas as pd
-from django.db import transaction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.base import File
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
 
 from .models import Dataset, Equipment
 from .utils import (
@@ -12,9 +25,39 @@ from .utils import (
     validate_csv_columns,
     clean_data,
     calculate_statistics,
+    calculate_extended_statistics,
 )
-from .constants import MAX_DATASETS_HISTORY, REQUIRED_CSV_COLUMNS
-from .exceptions import FileFormatError
+from .constants import (
+    BACKGROUND_UPLOAD_WORKERS,
+    COPY_THRESHOLD_ROWS,
+    CSV_PARSE_CACHE_TIMEOUT,
+    EQUIPMENT_ITERATOR_CHUNK_SIZE,
+    MAX_DATASETS_HISTORY,
+    PROCESSING_TIMEOUT_MINUTES,
+    REQUIRED_CSV_COLUMNS,
+    REQUIRED_CSV_COLUMNS_SET,
+)
+from .exceptions import FileFormatError, CSVValidationError
+
+logger = logging.getLogger(__name__)
+
+# Bounded pool for background uploads, so a burst of requests queues up
+# instead of parsing every file at once
+_upload_executor = ThreadPoolExecutor(
+    max_workers=BACKGROUND_UPLOAD_WORKERS,
+    thread_name_prefix='csv-upload'
+)
+
+
+class PendingUpload(File):
+    """Upload saved to disk for background processing, parsed like a spooled upload"""
+    
+    def __init__(self, file, name: str, path: str):
+        super().__init__(file, name=name)
+        self.path = path
+    
+    def temporary_file_path(self) -> str:
+        return self.path
 
 
 class DatasetService:
@@ -39,28 +82,56 @@ class DatasetService:
         if not validate_file_extension(csv_file.name):
             raise FileFormatError("File must be CSV format (.csv)")
         
-        # Read CSV with error handling
+        # The hash is needed before parsing to look up the cache. Spooled
+        # uploads (every HTTP upload, see FILE_UPLOAD_HANDLERS) are read twice:
+        # a chunked pass to hash, then pandas memory-maps the file, usually
+        # from the page cache. In-memory files are read once and the same
+        # bytes are hashed and parsed
+        digest = hashlib.sha256()
+        if hasattr(csv_file, 'temporary_file_path'):
+            for chunk in csv_file.chunks():
+                digest.update(chunk)
+            source = csv_file.temporary_file_path()
+        else:
+            data = csv_file.read()
+            digest.update(data)
+            source = io.BytesIO(data)
+        
+        # Identical re-uploads reuse the cleaned frame cached by content hash
+        frame_cache = caches['csv_frames']
+        cache_key = f"csv-parsed:{digest.hexdigest()}"
+        cached = frame_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Read CSV with error handling; only the required columns are parsed
         try:
-            df = pd.read_csv(csv_file)
+            df = pd.read_csv(
+                source,
+                usecols=lambda col: col in REQUIRED_CSV_COLUMNS_SET,
+                memory_map=isinstance(source, str)
+            )
         except Exception as e:
             raise FileFormatError(f"Error reading CSV file: {str(e)}")
         
-        # Check if DataFrame is empty
-        if df.empty:
-            raise FileFormatError("CSV file is empty")
-        
-        # Validate required columns
+        # Validate required columns (before the empty check, since a file
+        # without any required column parses to an empty frame)
         try:
             validate_csv_columns(df)
         except Exception as e:
             raise CSVValidationError(str(e))
         
+        # Check if DataFrame is empty
+        if df.empty:
+            raise FileFormatError("CSV file is empty")
+        
         # Clean and validate data
         try:
             df_clean = clean_data(df)
         except Exception as e:
             raise CSVValidationError(str(e))
         
+        frame_cache.set(cache_key, df_clean, timeout=CSV_PARSE_CACHE_TIMEOUT)
         return df_clean
     
     @staticmethod
@@ -68,7 +139,8 @@ class DatasetService:
     def create_dataset_with_equipment(
         user,
         filename: str,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        dataset: Optional[Dataset] = None
     ) -> Dataset:
         """
         Create dataset and equipment records from DataFrame
@@ -77,53 +149,222 @@ class DatasetService:
             user: User object (can be None)
             filename: Name of the uploaded file
             df: Cleaned DataFrame with equipment data
+            dataset: Placeholder dataset of a background upload to fill in,
+                instead of creating a new one
             
         Returns:
             Dataset: Created dataset object
         """
-        # Calculate statistics
         summary = calculate_statistics(df)
+        extended_summary = calculate_extended_statistics(df)
+        columns = [df[col].to_numpy() for col in REQUIRED_CSV_COLUMNS]
+        
+        # Create dataset with its summaries in a single INSERT, or complete
+        # the placeholder of a background upload
+        if dataset is None:
+            dataset = Dataset.objects.create(
+                user=user,
+                filename=filename,
+                total_records=len(df),
+                summary_data=summary,
+                extended_summary=extended_summary
+            )
+        else:
+            dataset.total_records = len(df)
+            dataset.status = Dataset.Status.READY
+            dataset.set_summary_data(summary)
+            dataset.extended_summary = extended_summary
+            dataset.save(update_fields=['total_records', 'status', 'summary_data', 'extended_summary'])
+        
+        # Create equipment records, zipping whole columns rather than boxing each row;
+        # large uploads on PostgreSQL bypass the ORM with COPY
+        if connection.vendor == 'postgresql' and len(df) > COPY_THRESHOLD_ROWS:
+            Equipment.copy_from_rows(dataset, zip(*columns))
+        else:
+            Equipment.bulk_from_rows(dataset, zip(*columns))
+        
+        return dataset
+    
+    @staticmethod
+    def schedule_upload(user, csv_file) -> Dataset:
+        """
+        Accept an upload and process it on the background upload pool
+        
+        A placeholder dataset in PROCESSING state is created right away;
+        a pool thread parses the file, fills the dataset in and marks it
+        READY, or FAILED with the error message. Uploads lost to a worker
+        restart are expired by cleanup_old_datasets.
+        
+        Args:
+            user: User object (can be None)
+            csv_file: Django UploadedFile object
+            
+        Returns:
+            Dataset: Placeholder dataset to poll for status
+            
+        Raises:
+            FileFormatError: If file format is invalid
+        """
+        if not validate_file_extension(csv_file.name):
+            raise FileFormatError("File must be CSV format (.csv)")
         
-        # Create dataset
+        # The request's upload is deleted with the response, so copy it to a
+        # pending file the thread parses from disk
+        pending_dir = settings.PENDING_UPLOAD_DIR
+        os.makedirs(pending_dir, exist_ok=True)
+        fd, pending_path = tempfile.mkstemp(suffix='.csv', dir=pending_dir)
+        with os.fdopen(fd, 'wb') as pending:
+            for chunk in csv_file.chunks():
+                pending.write(chunk)
+        
+        filename = csv_file.name
         dataset = Dataset.objects.create(
             user=user,
             filename=filename,
-            total_records=len(df)
+            status=Dataset.Status.PROCESSING
         )
-        dataset.set_summary_data(summary)
-        dataset.save()
-        
-        # Create equipment records
-        equipment_list = [
-            Equipment(
-                dataset=dataset,
-                equipment_name=row['Equipment Name'],
-                equipment_type=row['Type'],
-                flowrate=float(row['Flowrate']),
-                pressure=float(row['Pressure']),
-                temperature=float(row['Temperature'])
+        
+        def mark_failed(message: str) -> None:
+            Dataset.objects.filter(pk=dataset.pk).update(
+                status=Dataset.Status.FAILED,
+                status_message=message[:255]
             )
-            for _, row in df.iterrows()
-        ]
         
-        Equipment.objects.bulk_create(equipment_list)
+        def run_upload():
+            try:
+                with open(pending_path, 'rb') as fh:
+                    df = DatasetService.validate_and_parse_csv(PendingUpload(fh, filename, pending_path))
+                DatasetService.create_dataset_with_equipment(user, filename, df, dataset=dataset)
+            except (FileFormatError, CSVValidationError) as e:
+                mark_failed(str(e))
+            except Exception as e:
+                logger.error(f"Error during background CSV upload: {str(e)}", exc_info=True)
+                mark_failed('Failed to process CSV file. Please check the format and try again.')
+            else:
+                try:
+                    DatasetService.cleanup_old_datasets()
+                except Exception as e:
+                    logger.warning(f"Non-critical cleanup error: {str(e)}")
+            finally:
+                os.remove(pending_path)
+                connection.close()
         
+        transaction.on_commit(lambda: _upload_executor.submit(run_upload))
         return dataset
     
     @staticmethod
     def cleanup_old_datasets() -> int:
         """
-        Remove datasets beyond the history limit (keep last 5)
+        Remove datasets beyond the history limit (keep last 5 ready ones)
+        
+        Only READY datasets count towards the limit. Datasets still
+        PROCESSING are kept while a background upload may be writing to
+        them; past PROCESSING_TIMEOUT_MINUTES their upload is presumed lost
+        with a restarted worker, so they are marked FAILED and removed with
+        other stale failures, along with leftover pending upload files.
+        FAILED datasets are also removed once they are older than the
+        oldest dataset kept.
         
         Returns:
             int: Number of datasets deleted
         """
-        # Get IDs of datasets to keep (last MAX_DATASETS_HISTORY)
-        datasets_to_keep = Dataset.objects.all().order_by('-uploaded_at')[:MAX_DATASETS_HISTORY].values_list('id', flat=True)
+        stale_before = timezone.now() - timedelta(minutes=PROCESSING_TIMEOUT_MINUTES)
+        Dataset.objects.filter(
+            status=Dataset.Status.PROCESSING,
+            uploaded_at__lt=stale_before
+        ).update(
+            status=Dataset.Status.FAILED,
+            status_message='Processing did not finish in time. Please upload the file again.'
+        )
+        stale_count, _ = Dataset.objects.filter(
+            status=Dataset.Status.FAILED,
+            uploaded_at__lt=stale_before
+        ).delete()
+        DatasetService._sweep_pending_uploads(stale_before)
         
-        # Delete all others
-        deleted_count, _ = Dataset.objects.exclude(id__in=list(datasets_to_keep)).delete()
-        return deleted_count
+        # Upload time of the oldest ready dataset to keep (last MAX_DATASETS_HISTORY)
+        cutoff = (
+            Dataset.objects.filter(status=Dataset.Status.READY)
+            .order_by('-uploaded_at')
+            .values_list('uploaded_at', flat=True)[MAX_DATASETS_HISTORY - 1:MAX_DATASETS_HISTORY]
+            .first()
+        )
+        if cutoff is None:
+            return stale_count
+        
+        # Delete everything older in one statement; no ID list round trip
+        deleted_count, _ = (
+            Dataset.objects.filter(uploaded_at__lt=cutoff)
+            .exclude(status=Dataset.Status.PROCESSING)
+            .delete()
+        )
+        return stale_count + deleted_count
+    
+    @staticmethod
+    def _sweep_pending_uploads(stale_before: datetime) -> None:
+        """
+        Delete pending upload files left behind by uploads that never finished
+        
+        Args:
+            stale_before: Files last modified before this time are removed
+        """
+        try:
+            entries = list(os.scandir(settings.PENDING_UPLOAD_DIR))
+        except FileNotFoundError:
+            return
+        
+        cutoff = stale_before.timestamp()
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except FileNotFoundError:
+                # Finished and removed by its upload in the meantime
+                pass
+    
+    @staticmethod
+    def schedule_cleanup() -> None:
+        """
+        Run cleanup_old_datasets in a background thread once the current
+        transaction commits, keeping the DELETE off the request path
+        """
+        def run_cleanup():
+            try:
+                DatasetService.cleanup_old_datasets()
+            except Exception as e:
+                logger.warning(f"Non-critical cleanup error: {str(e)}")
+            finally:
+                # The thread opened its own connection; don't leak it
+                connection.close()
+        
+        transaction.on_commit(
+            lambda: threading.Thread(target=run_cleanup, daemon=True).start()
+        )
+    
+    @staticmethod
+    def iter_equipment(dataset: Dataset, *fields: str, ordered: bool = True) -> Iterator:
+        """
+        Stream a dataset's equipment records in chunks
+        
+        Uses a server-side cursor on PostgreSQL, so memory stays bounded
+        regardless of dataset size.
+        
+        Args:
+            dataset: Dataset whose records to stream
+            *fields: Optional field names; if given, value tuples of these
+                fields are yielded instead of Equipment instances
+            ordered: Keep the default equipment_name ordering; callers that
+                only aggregate pass False to skip the ORDER BY
+            
+        Returns:
+            Iterator: Equipment instances or value tuples
+        """
+        queryset = dataset.equipment_records.all()
+        if not ordered:
+            queryset = queryset.order_by()
+        if fields:
+            queryset = queryset.values_list(*fields)
+        return queryset.iterator(chunk_size=EQUIPMENT_ITERATOR_CHUNK_SIZE)
     
     @staticmethod
     def get_dataset_with_summary(dataset_id: int) -> Dict[str, Any]:
@@ -136,27 +377,33 @@ class DatasetService:
         Returns:
             Dict[str, Any]: Dataset information
         """
-        try:
-            dataset = Dataset.objects.get(id=dataset_id)
-            return {
-                'id': dataset.id,
-                'filename': dataset.filename,
-                'uploaded_at': dataset.uploaded_at,
-                'total_records': dataset.total_records,
-                'summary': dataset.get_summary_data(),
-            }
-        except Dataset.DoesNotExist:
+        # Fetch just the returned columns as a dict; no model instance needed
+        row = Dataset.objects.filter(id=dataset_id).values(
+            'id', 'filename', 'uploaded_at', 'total_records', 'summary_data'
+        ).first()
+        if row is None:
             return None
+        
+        row['summary'] = row.pop('summary_data') or {}
+        return row
     
     @staticmethod
-    def get_recent_datasets(limit: int = 5) -> List[Dataset]:
+    def get_recent_datasets(limit: int = 5) -> QuerySet:
         """
         Get most recent datasets ordered by upload time
         
+        The queryset is returned unevaluated so callers can chain or
+        iterate it. summary_data is deferred and served from the cache by
+        get_summary_data() when a caller needs it.
+        
         Args:
             limit: Number of datasets to retrieve
             
         Returns:
-            List[Dataset]: List of recent datasets
+            QuerySet: Recent datasets, newest first
         """
-        return list(Dataset.objects.all().order_by('-uploaded_at')[:limit])
+        return (
+            Dataset.objects.defer('summary_data', 'extended_summary')
+            .select_related('user')
+            .order_by('-uploaded_at')[:limit]
+        )
@@ -1,3 +1,299 @@
-from django.test import TestCase
+import csv
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import pandas as pd
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.utils import timezone
+from reportlab.platypus import Table
+
+from .constants import PROCESSING_TIMEOUT_MINUTES
+from .exceptions import InvalidDataError
+from .models import Dataset, Equipment
+from .pdf_service import PDFReportGenerator
+from .services import DatasetService
+from .utils import clean_data
+
+CSV_HEADER = "Equipment Name,Type,Flowrate,Pressure,Temperature\n"
+VALID_CSV = CSV_HEADER + "Pump-1,Pump,100,5.2,300\nValve-1,Valve,80,4.1,310\n"
+
+
+def csv_upload(content: str, name: str = 'equipment.csv') -> SimpleUploadedFile:
+    return SimpleUploadedFile(name, content.encode(), content_type='text/csv')
+
+
+@mock.patch('equipment.views.LARGE_UPLOAD_THRESHOLD_MB', 0)
+class BackgroundUploadTests(TransactionTestCase):
+    """Uploads sent with Prefer: respond-async are processed in a background thread"""
+
+    def upload_async(self, content: str):
+        return self.client.post(
+            '/api/datasets/upload/',
+            {'file': csv_upload(content)},
+            headers={'Prefer': 'respond-async'}
+        )
+
+    def wait_for_status(self, dataset_id: int) -> dict:
+        deadline = time.monotonic() + 10
+        while True:
+            response = self.client.get(f'/api/datasets/{dataset_id}/status/')
+            self.assertEqual(response.status_code, 200)
+            if response.json()['status'] != Dataset.Status.PROCESSING or time.monotonic() > deadline:
+                return response.json()
+            time.sleep(0.05)
+
+    def test_upload_is_accepted_then_ready(self):
+        response = self.upload_async(VALID_CSV)
+
+        self.assertEqual(response.status_code, 202)
+        data = response.json()['data']
+        self.assertEqual(data['status'], Dataset.Status.PROCESSING)
+
+        status = self.wait_for_status(data['id'])
+        self.assertEqual(status['status'], Dataset.Status.READY)
+        self.assertEqual(status['total_records'], 2)
+        self.assertEqual(Dataset.objects.get(pk=data['id']).equipment_records.count(), 2)
+
+    def test_invalid_upload_is_marked_failed(self):
+        response = self.upload_async("Equipment Name,Type\nPump-1,Pump\n")
+
+        self.assertEqual(response.status_code, 202)
+        status = self.wait_for_status(response.json()['data']['id'])
+        self.assertEqual(status['status'], Dataset.Status.FAILED)
+        self.assertIn('Missing required columns', status['message'])
+
+    def test_processing_dataset_is_not_listed(self):
+        Dataset.objects.create(filename='pending.csv', status=Dataset.Status.PROCESSING)
+
+        response = self.client.get('/api/datasets/')
+
+        self.assertEqual(response.json(), [])
+
+
+class CleanupOldDatasetsTests(TestCase):
+    """History retention only counts and trims finished datasets"""
+
+    def test_keeps_latest_ready_datasets_and_processing_ones(self):
+        processing = Dataset.objects.create(filename='pending.csv', status=Dataset.Status.PROCESSING)
+        failed = Dataset.objects.create(filename='failed.csv', status=Dataset.Status.FAILED)
+        ready = [Dataset.objects.create(filename=f'ready-{i}.csv') for i in range(7)]
+
+        DatasetService.cleanup_old_datasets()
+
+        remaining = set(Dataset.objects.values_list('pk', flat=True))
+        self.assertEqual(remaining, {processing.pk} | {dataset.pk for dataset in ready[-5:]})
+        self.assertNotIn(failed.pk, remaining)
+
+    def test_failed_datasets_do_not_take_history_slots(self):
+        ready = [Dataset.objects.create(filename=f'ready-{i}.csv') for i in range(5)]
+        for i in range(3):
+            Dataset.objects.create(filename=f'failed-{i}.csv', status=Dataset.Status.FAILED)
+
+        DatasetService.cleanup_old_datasets()
+
+        self.assertEqual(
+            Dataset.objects.filter(status=Dataset.Status.READY).count(),
+            len(ready)
+        )
+
+
+class StaleUploadCleanupTests(TestCase):
+    """Uploads lost with a restarted worker don't linger in PROCESSING"""
+
+    def setUp(self):
+        self.pending_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.pending_dir)
+
+    def test_expires_stale_processing_datasets(self):
+        stale = Dataset.objects.create(filename='stale.csv', status=Dataset.Status.PROCESSING)
+        Dataset.objects.filter(pk=stale.pk).update(
+            uploaded_at=timezone.now() - timedelta(minutes=PROCESSING_TIMEOUT_MINUTES + 1)
+        )
+        fresh = Dataset.objects.create(filename='fresh.csv', status=Dataset.Status.PROCESSING)
+
+        with self.settings(PENDING_UPLOAD_DIR=self.pending_dir):
+            DatasetService.cleanup_old_datasets()
+
+        self.assertEqual(list(Dataset.objects.values_list('pk', flat=True)), [fresh.pk])
+
+    def test_sweeps_orphaned_pending_files(self):
+        orphan = os.path.join(self.pending_dir, 'orphan.csv')
+        current = os.path.join(self.pending_dir, 'current.csv')
+        for path in (orphan, current):
+            with open(path, 'w') as fh:
+                fh.write(VALID_CSV)
+        old = time.time() - (PROCESSING_TIMEOUT_MINUTES + 1) * 60
+        os.utime(orphan, (old, old))
+
+        with self.settings(PENDING_UPLOAD_DIR=self.pending_dir):
+            DatasetService.cleanup_old_datasets()
+
+        self.assertEqual(os.listdir(self.pending_dir), ['current.csv'])
+
+
+class ParsedCsvCacheTests(SimpleTestCase):
+    """Identical re-uploads reuse the cleaned frame instead of parsing again"""
+
+    def setUp(self):
+        caches['csv_frames'].clear()
+
+    def test_identical_upload_returns_cached_frame(self):
+        first = DatasetService.validate_and_parse_csv(csv_upload(VALID_CSV))
+
+        with mock.patch('equipment.services.pd.read_csv') as read_csv:
+            second = DatasetService.validate_and_parse_csv(csv_upload(VALID_CSV, name='copy.csv'))
+
+        read_csv.assert_not_called()
+        pd.testing.assert_frame_equal(first, second)
+
+
+class CleanDataTests(SimpleTestCase):
+    """clean_data rejects rows the database constraints would refuse"""
+
+    def test_negative_flowrate_or_pressure_rejects_the_upload(self):
+        df = pd.DataFrame({
+            'Equipment Name': ['Pump-1', 'Pump-2', 'Pump-3', 'Pump-4'],
+            'Type': ['Pump'] * 4,
+            'Flowrate': [100, -1, 50, 'abc'],
+            'Pressure': [5.0, 4.0, -0.5, 3.0],
+            'Temperature': [-20, 300, 310, 320],
+        })
+
+        with self.assertRaisesMessage(InvalidDataError, 'CSV lines 3, 4)'):
+            clean_data(df)
+
+    def test_negative_temperature_is_allowed(self):
+        df = pd.DataFrame({
+            'Equipment Name': ['Pump-1', 'Pump-2'],
+            'Type': ['Pump'] * 2,
+            'Flowrate': [100, 'abc'],
+            'Pressure': [5.0, 3.0],
+            'Temperature': [-20, 320],
+        })
+
+        df_clean = clean_data(df)
+
+        self.assertEqual(list(df_clean['Equipment Name']), ['Pump-1'])
+
+    def test_upload_with_negative_row_is_refused(self):
+        response = self.client.post(
+            '/api/datasets/upload/',
+            {'file': csv_upload(VALID_CSV + "Pump-2,Pump,-5,1.0,300\n")}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['type'], 'validation_error')
+        self.assertIn('CSV lines 4)', response.json()['error'])
+
+
+class ResponseCompressionTests(TestCase):
+    """API JSON is gzipped; PDF reports are sent as-is with their length"""
+
+    def setUp(self):
+        caches['reports'].clear()
+        self.client.post('/api/datasets/upload/', {'file': csv_upload(VALID_CSV)})
+        self.dataset = Dataset.objects.get()
+
+    def test_json_is_gzipped(self):
+        response = self.client.get('/api/datasets/', HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_pdf_is_not_gzipped(self):
+        response = self.client.get(
+            f'/api/datasets/{self.dataset.pk}/generate_pdf/',
+            HTTP_ACCEPT_ENCODING='gzip'
+        )
+        body = b''.join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(int(response['Content-Length']), len(body))
+        self.assertTrue(body.startswith(b'%PDF-'))
+
+
+class PDFReportTests(TestCase):
+    """Reports render from precomputed or live statistics and are cached"""
+
+    REPORT_CSV = CSV_HEADER + "".join(
+        f"{name}-{i},{name},{100 + 7 * i},{2.5 + 0.25 * i},{290 + 3 * i}\n"
+        for i, name in enumerate(['Pump', 'Valve', 'Reactor', 'Pump', 'Valve', 'Pump'])
+    )
+
+    def setUp(self):
+        caches['reports'].clear()
+        df = DatasetService.validate_and_parse_csv(csv_upload(self.REPORT_CSV))
+        self.dataset = DatasetService.create_dataset_with_equipment(None, 'report.csv', df)
+
+    def statistics_tables(self, generator: PDFReportGenerator) -> list:
+        styles = generator.styles
+        sections = (
+            generator._create_enhanced_statistics_section(styles)
+            + generator._create_equipment_type_breakdown(styles)
+        )
+        return [flowable._cellvalues for flowable in sections if isinstance(flowable, Table)]
+
+    def test_fallback_statistics_match_precomputed(self):
+        self.assertTrue(self.dataset.extended_summary)
+        precomputed = PDFReportGenerator(self.dataset)
+
+        live_dataset = Dataset.objects.get(pk=self.dataset.pk)
+        live_dataset.extended_summary = {}
+        live = PDFReportGenerator(live_dataset)
+
+        self.assertEqual(self.statistics_tables(live), self.statistics_tables(precomputed))
+        for generator in (precomputed, live):
+            caches['reports'].clear()
+            self.assertTrue(generator.generate().getvalue().startswith(b'%PDF-'))
+
+    def test_second_report_is_served_from_cache(self):
+        generator = PDFReportGenerator(self.dataset)
+        first = generator.generate().getvalue()
+        self.assertEqual(caches['reports'].get(generator.cache_key), first)
+
+        with mock.patch('equipment.pdf_service.SimpleDocTemplate') as document:
+            second = PDFReportGenerator(self.dataset).generate().getvalue()
+
+        document.assert_not_called()
+        self.assertEqual(second, first)
+
+
+class EquipmentCopyTests(TestCase):
+    """Rows written through the PostgreSQL COPY path round-trip unchanged"""
+
+    ROWS = [
+        ('', 'Pump', 1.5, 2.25, 300.0),
+        ('Valve "A", north', 'Valve', 0.0, 10.75, -12.5),
+        ('Reactor, 2', 'Reactor "HT"', 1024.125, 0.5, 451.0),
+    ]
+
+    def setUp(self):
+        self.dataset = Dataset.objects.create(filename='copy.csv', total_records=len(self.ROWS))
+
+    def test_copy_csv_quotes_text_and_keeps_floats(self):
+        buffer, count = Equipment.copy_csv(self.dataset, self.ROWS)
+
+        self.assertEqual(count, len(self.ROWS))
+        # Text is always quoted, so an empty name is "" rather than a NULL
+        self.assertTrue(buffer.getvalue().startswith(f'{self.dataset.pk},"",'))
+        parsed = list(csv.reader(buffer, quoting=csv.QUOTE_NONNUMERIC))
+        self.assertEqual(parsed, [[self.dataset.pk, *row] for row in self.ROWS])
+
+    @skipUnless(connection.vendor == 'postgresql', 'COPY is only used on PostgreSQL')
+    def test_copy_from_rows_round_trip(self):
+        written = Equipment.copy_from_rows(self.dataset, self.ROWS)
+
+        stored = list(
+            Equipment.objects.filter(dataset=self.dataset).order_by('id').values_list(
+                'equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature'
+            )
+        )
+        self.assertEqual(written, len(self.ROWS))
+        self.assertEqual(stored, self.ROWS)
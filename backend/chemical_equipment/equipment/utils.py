@@ -5,7 +5,13 @@ Utility functions for the equipment app
 import csv
 from typing import Dict, List, Any
 import pandas as pd
-from .constants import REQUIRED_CSV_COLUMNS, NUMERIC_FIELDS
+from .constants import (
+    REQUIRED_CSV_COLUMNS,
+    REQUIRED_CSV_COLUMNS_SET,
+    NUMERIC_FIELDS,
+    NON_NEGATIVE_FIELDS,
+    MAX_REPORTED_INVALID_ROWS,
+)
 from .exceptions import (
     FileFormatError,
     MissingColumnsError,
@@ -40,7 +46,8 @@ def validate_csv_columns(df: pd.DataFrame) -> List[str]:
     Raises:
         MissingColumnsError: If required columns are missing
     """
-    missing_columns = [col for col in REQUIRED_CSV_COLUMNS if col not in df.columns]
+    missing = REQUIRED_CSV_COLUMNS_SET.difference(df.columns)
+    missing_columns = [col for col in REQUIRED_CSV_COLUMNS if col in missing]
     
     if missing_columns:
         raise MissingColumnsError(
@@ -63,29 +70,46 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
         
     Raises:
         NoValidDataError: If no valid data remains after cleaning
-        InvalidDataError: If numeric columns contain invalid values
+        InvalidDataError: If numeric columns contain invalid values, or
+            flowrate or pressure is negative
     """
-    # Check for missing values
-    df_clean = df.dropna(subset=REQUIRED_CSV_COLUMNS)
+    # Rows with every required value present; a mask only, nothing is copied yet
+    present = df[list(REQUIRED_CSV_COLUMNS)].notna().all(axis=1)
     
-    if len(df_clean) == 0:
+    if not present.any():
         raise NoValidDataError("No valid data found in CSV after removing missing values")
     
-    # Validate numeric columns
-    for col in NUMERIC_FIELDS:
-        if col in df_clean.columns:
-            try:
-                # Try to convert to numeric
-                df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-                # Remove rows where conversion failed (NaN)
-                df_clean = df_clean[df_clean[col].notna()]
-            except Exception as e:
-                raise InvalidDataError(f"Invalid numeric values in column '{col}': {str(e)}")
+    # Coerce all numeric columns in one pass; unparseable values become NaN
+    try:
+        numeric = df[list(NUMERIC_FIELDS)].apply(pd.to_numeric, errors='coerce')
+    except Exception as e:
+        raise InvalidDataError(f"Invalid numeric values: {str(e)}")
+    
+    # Keep rows that are complete and parsed, filtering the frame once with a combined mask
+    valid = present & numeric.notna().all(axis=1)
+    
+    # Negative flowrate or pressure would violate the database constraints;
+    # reject the upload naming the rows rather than silently dropping them
+    negative = valid & (numeric[list(NON_NEGATIVE_FIELDS)] < 0).any(axis=1)
+    if negative.any():
+        # Data rows start on line 2, after the header
+        lines = [str(row + 2) for row in df.index[negative]]
+        listed = ', '.join(lines[:MAX_REPORTED_INVALID_ROWS])
+        if len(lines) > MAX_REPORTED_INVALID_ROWS:
+            listed += f' and {len(lines) - MAX_REPORTED_INVALID_ROWS} more'
+        raise InvalidDataError(
+            f"{' and '.join(NON_NEGATIVE_FIELDS)} must not be negative (CSV lines {listed})"
+        )
+    
+    df_clean = df.assign(**numeric)[valid]
     
     # Final check
     if len(df_clean) == 0:
         raise NoValidDataError("No valid data found in CSV after validating numeric columns")
     
+    # Types repeat heavily; integer category codes make counting and grouping cheap
+    df_clean['Type'] = df_clean['Type'].astype(str).astype('category')
+    
     return df_clean
 
 
@@ -117,23 +141,63 @@ def calculate_statistics(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Dictionary containing statistical summaries
     """
-    statistics = {
-        'total_count': len(df),
-        'avg_flowrate': float(df['Flowrate'].mean()),
-        'avg_pressure': float(df['Pressure'].mean()),
-        'avg_temperature': float(df['Temperature'].mean()),
-        'min_flowrate': float(df['Flowrate'].min()),
-        'max_flowrate': float(df['Flowrate'].max()),
-        'min_pressure': float(df['Pressure'].min()),
-        'max_pressure': float(df['Pressure'].max()),
-        'min_temperature': float(df['Temperature'].min()),
-        'max_temperature': float(df['Temperature'].max()),
-        'type_distribution': df['Type'].value_counts().to_dict(),
-    }
+    # One agg call replaces nine separate Series reductions
+    agg = df[list(NUMERIC_FIELDS)].agg(['mean', 'min', 'max'])
+    
+    statistics = {'total_count': len(df)}
+    for col in NUMERIC_FIELDS:
+        statistics[f'avg_{col.lower()}'] = float(agg.at['mean', col])
+    for col in NUMERIC_FIELDS:
+        statistics[f'min_{col.lower()}'] = float(agg.at['min', col])
+        statistics[f'max_{col.lower()}'] = float(agg.at['max', col])
+    # Unsorted counts; the histogram doesn't need frequency order
+    statistics['type_distribution'] = df['Type'].value_counts(sort=False).to_dict()
     
     return statistics
 
 
+def calculate_extended_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Calculate spread statistics and per-type averages from equipment data
+    
+    Args:
+        df: Pandas DataFrame with equipment data
+        
+    Returns:
+        Dict[str, Any]: 'per_param' median/std_dev/variance keyed by
+        lowercase parameter name, and 'per_type' rows sorted by type
+    """
+    numeric = df[list(NUMERIC_FIELDS)].astype(float)
+    medians = numeric.median()
+    std_devs = numeric.std(ddof=0)
+    variances = numeric.var(ddof=0)
+    
+    per_param = {
+        col.lower(): {
+            'median': float(medians[col]),
+            'std_dev': float(std_devs[col]),
+            'variance': float(variances[col]),
+        }
+        for col in NUMERIC_FIELDS
+    }
+    
+    grouped = numeric.groupby(df['Type'], observed=True)
+    means = grouped.mean()
+    counts = grouped.size()
+    per_type = [
+        {
+            'equipment_type': str(eq_type),
+            'count': int(counts[eq_type]),
+            'avg_flowrate': float(means.at[eq_type, 'Flowrate']),
+            'avg_pressure': float(means.at[eq_type, 'Pressure']),
+            'avg_temperature': float(means.at[eq_type, 'Temperature']),
+        }
+        for eq_type in means.index
+    ]
+    
+    return {'per_param': per_param, 'per_type': per_type}
+
+
 def format_number(value: float, decimals: int = 2) -> float:
     """
     Format number to specified decimal places
@@ -6,11 +6,16 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.http import HttpResponse
+from django.db.models import Prefetch
+from django.http import FileResponse
 import logging
 
 from .models import Dataset
-from .serializers import DatasetDetailSerializer, DatasetListSerializer
+from .serializers import (
+    DatasetDetailSerializer,
+    DatasetListSerializer,
+    EquipmentSerializer,
+)
 from .services import DatasetService
 from .exceptions import (
     FileFormatError,
@@ -18,6 +23,7 @@ from .exceptions import (
     PDFGenerationError,
 )
 from .pdf_service import PDFReportGenerator
+from .constants import LARGE_UPLOAD_THRESHOLD_MB, MAX_DATASETS_HISTORY
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +41,15 @@ class DatasetViewSet(viewsets.ModelViewSet):
     queryset = Dataset.objects.all()
     permission_classes = [AllowAny]
     
+    def get_queryset(self):
+        """Prefetch equipment records for actions that serialize them"""
+        queryset = Dataset.objects.all()
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.defer('extended_summary').prefetch_related(
+                Prefetch('equipment_records', to_attr='prefetched_equipment')
+            )
+        return queryset
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on action"""
         if self.action == 'list':
@@ -43,7 +58,11 @@ class DatasetViewSet(viewsets.ModelViewSet):
     
     def list(self, request):
         """Get last 5 datasets ordered by upload time"""
-        datasets = Dataset.objects.all().order_by('-uploaded_at')[:5]
+        datasets = (
+            self.get_queryset()
+            .filter(status=Dataset.Status.READY)
+            .order_by('-uploaded_at')[:MAX_DATASETS_HISTORY]
+        )
         serializer = self.get_serializer(datasets, many=True)
         return Response(serializer.data)
     
@@ -60,31 +79,54 @@ class DatasetViewSet(viewsets.ModelViewSet):
             )
         
         csv_file = request.FILES['file']
+        user = request.user if request.user.is_authenticated else None
         
         try:
+            # Large files are processed in the background for clients that ask
+            if (
+                csv_file.size > LARGE_UPLOAD_THRESHOLD_MB * 1024 * 1024
+                and 'respond-async' in request.headers.get('Prefer', '')
+            ):
+                dataset = DatasetService.schedule_upload(user, csv_file)
+                return Response(
+                    {
+                        'success': True,
+                        'message': f'Dataset "{csv_file.name}" accepted for processing',
+                        'data': {'id': dataset.id, 'status': dataset.status}
+                    },
+                    status=status.HTTP_202_ACCEPTED
+                )
+            
             # Validate and parse CSV using service
             df = DatasetService.validate_and_parse_csv(csv_file)
             
             # Create dataset with equipment records
             dataset = DatasetService.create_dataset_with_equipment(
-                user=request.user if request.user.is_authenticated else None,
+                user=user,
                 filename=csv_file.name,
                 df=df
             )
             
-            # Cleanup old datasets (non-blocking)
-            try:
-                DatasetService.cleanup_old_datasets()
-            except Exception as cleanup_error:
-                logger.warning(f"Non-critical cleanup error: {str(cleanup_error)}")
+            # Cleanup old datasets in the background
+            DatasetService.schedule_cleanup()
             
-            # Return created dataset with success response
-            serializer = self.get_serializer(dataset)
+            # Return created dataset with success response. The payload mirrors
+            # DatasetDetailSerializer but is built directly from the instance we
+            # just saved, so no serializer fields are bound or introspected.
             return Response(
                 {
                     'success': True,
                     'message': f'Dataset "{csv_file.name}" uploaded successfully with {dataset.total_records} records',
-                    'data': serializer.data
+                    'data': {
+                        'id': dataset.id,
+                        'filename': dataset.filename,
+                        'uploaded_at': dataset.uploaded_at,
+                        'total_records': dataset.total_records,
+                        'summary': dataset.get_summary_data(),
+                        'equipment_records': list(
+                            dataset.equipment_records.values(*EquipmentSerializer.Meta.fields)
+                        ),
+                    }
                 },
                 status=status.HTTP_201_CREATED
             )
@@ -121,6 +163,17 @@ class DatasetViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
     
+    @action(detail=True, methods=['get'], url_path='status')
+    def upload_status(self, request, pk=None):
+        """Report the processing status of a dataset, for polling background uploads"""
+        dataset = self.get_object()
+        return Response({
+            'id': dataset.id,
+            'status': dataset.status,
+            'message': dataset.status_message,
+            'total_records': dataset.total_records,
+        })
+    
     @action(detail=True, methods=['get'])
     def generate_pdf(self, request, pk=None):
         """
@@ -140,12 +193,13 @@ class DatasetViewSet(viewsets.ModelViewSet):
             pdf_generator = PDFReportGenerator(dataset)
             pdf_buffer = pdf_generator.generate()
             
-            # Return PDF response
-            response = HttpResponse(pdf_buffer.getvalue(), content_type='application/pdf')
-            response['Content-Disposition'] = (
-                f'attachment; filename="chemflow_report_{dataset.id}.pdf"'
+            # Stream the buffer back in blocks instead of copying it into the response
+            return FileResponse(
+                pdf_buffer,
+                as_attachment=True,
+                filename=f'chemflow_report_{dataset.id}.pdf',
+                content_type='application/pdf'
             )
-            return response
             
         except Dataset.DoesNotExist:
             logger.warning(f"Dataset not found: {pk}")
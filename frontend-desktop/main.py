@@ -7,26 +7,30 @@ Version: 2.0
 
 import sys
 import os
+import time
 import logging
-from typing import Optional, Dict, List, Any
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional, Dict, List
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QFileDialog, QTableWidget, QTableWidgetItem, 
+    QPushButton, QLabel, QFileDialog, QTableWidget, QTableWidgetItem, QTableView,
     QTabWidget, QMessageBox, QProgressBar, QComboBox, QGroupBox,
-    QGridLayout, QHeaderView, QTextEdit, QSplitter, QLineEdit,
-    QCheckBox, QDialog, QDialogButtonBox, QSpinBox
+    QGridLayout, QHeaderView, QTextEdit, QLineEdit,
+    QCheckBox, QDialog, QDialogButtonBox, QSpinBox, QStyledItemDelegate, QStyle
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSettings
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import pandas as pd
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer, QSettings,
+    QSortFilterProxyModel, QAbstractTableModel, QModelIndex, QEvent, QRect, QSize,
+    QDateTime
+)
+from PyQt5.QtGui import QFont, QPainter, QColor
+import numpy as np
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.util.retry import Retry
 from datetime import datetime
 import csv
 
@@ -46,7 +50,95 @@ DEFAULT_API_BASE_URL = 'http://localhost:8000/api'
 API_TIMEOUT = 30
 MAX_FILE_SIZE_MB = 50
 REQUIRED_COLUMNS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
+# Equipment record keys in data table column order
+TABLE_HEADERS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+TABLE_TEXT_FIELDS = ('equipment_name', 'equipment_type')
+TABLE_NUMERIC_FIELDS = ('flowrate', 'pressure', 'temperature')
+TABLE_FIELDS = TABLE_TEXT_FIELDS + TABLE_NUMERIC_FIELDS
 APP_VERSION = '2.0'
+# Min/avg/max summary keys per parameter, in chart order
+SUMMARY_PARAMETERS = ('Flowrate', 'Pressure', 'Temperature')
+SUMMARY_STAT_KEYS = tuple(
+    tuple(f'{stat}_{param.lower()}' for param in SUMMARY_PARAMETERS)
+    for stat in ('min', 'avg', 'max')
+)
+_PARAM_X = np.arange(len(SUMMARY_PARAMETERS))
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 20
+HTTP_MAX_RETRIES = 3
+# Worker threads shared by uploads and background refreshes
+BACKGROUND_POOL_SIZE = 4
+# Dataset views refreshed lazily, keyed by the tab that shows them
+TAB_VIEWS = {1: 'dashboard', 2: 'chart', 3: 'table'}
+# Delay after the last keystroke before the data table is filtered
+SEARCH_DEBOUNCE_MS = 150
+# Bytes written per chunk when saving a downloaded PDF report
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Minimum seconds between upload progress signals (~20 updates per second)
+PROGRESS_MIN_INTERVAL = 0.05
+
+# Stylesheets applied after startup
+HISTORY_TABLE_QSS = '''
+    QTableWidget {
+        gridline-color: #D1D5DB;
+        background-color: white;
+        border: 1px solid #D1D5DB;
+        border-radius: 5px;
+    }
+    QHeaderView::section {
+        background-color: #8B5CF6;
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+        border: none;
+    }
+'''
+UPLOAD_SUCCESS_QSS = '''
+    padding: 12px;
+    border-radius: 8px;
+    margin-top: 10px;
+    background-color: #DCFCE7;
+    border: 2px solid #22C55E;
+    color: #166534;
+    font-weight: bold;
+'''
+UPLOAD_ERROR_QSS = '''
+    padding: 12px;
+    border-radius: 8px;
+    margin-top: 10px;
+    background-color: #FEE2E2;
+    border: 2px solid #EF4444;
+    color: #991B1B;
+    font-weight: bold;
+'''
+
+
+def format_timestamp(value: str, fmt: str) -> str:
+    """Format an ISO 8601 API timestamp with a Qt date format, or 'Unknown'"""
+    parsed = QDateTime.fromString(value, Qt.ISODateWithMs)
+    return parsed.toString(fmt) if parsed.isValid() else 'Unknown'
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session shared by all API calls"""
+    session = requests.Session()
+    # Retry transient gateway errors on idempotent requests only; uploads
+    # (POST) are never replayed.
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504]
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = f'ChemicalEquipmentVisualizer/{APP_VERSION}'
+    return session
 
 
 class Config:
@@ -54,18 +146,26 @@ class Config:
     
     def __init__(self):
         self.settings = QSettings('ChemicalEquipment', 'Visualizer')
+        # Values read from QSettings, kept so each API call skips the backend
+        self._cache = {}
         
     def get_api_url(self) -> str:
-        return self.settings.value('api_url', DEFAULT_API_BASE_URL)
+        if 'api_url' not in self._cache:
+            self._cache['api_url'] = self.settings.value('api_url', DEFAULT_API_BASE_URL)
+        return self._cache['api_url']
     
     def set_api_url(self, url: str):
         self.settings.setValue('api_url', url)
+        self._cache['api_url'] = url
     
     def get_api_timeout(self) -> int:
-        return self.settings.value('api_timeout', API_TIMEOUT, type=int)
+        if 'api_timeout' not in self._cache:
+            self._cache['api_timeout'] = self.settings.value('api_timeout', API_TIMEOUT, type=int)
+        return self._cache['api_timeout']
     
     def set_api_timeout(self, timeout: int):
         self.settings.setValue('api_timeout', timeout)
+        self._cache['api_timeout'] = timeout
 
 
 class SettingsDialog(QDialog):
@@ -113,229 +213,478 @@ class SettingsDialog(QDialog):
         self.accept()
 
 
-class UploadThread(QThread):
-    """Background thread for file upload with improved error handling"""
+class UploadSignals(QObject):
+    """Signals emitted by UploadTask (QRunnable cannot define its own)"""
     
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
+
+
+class UploadTask(QRunnable):
+    """Background file upload run on the shared thread pool"""
     
-    def __init__(self, file_path: str, api_url: str, timeout: int):
+    def __init__(self, file_path: str, api_url: str, timeout: int, session: requests.Session):
         super().__init__()
+        self.signals = UploadSignals()
+        self.session = session
         self.file_path = file_path
         self.api_url = api_url
         self.timeout = timeout
+        self._last_progress = 0
+        self._last_progress_time = 0.0
     
     def run(self):
         try:
             logger.info(f'Starting upload of file: {self.file_path}')
-            self.progress.emit(10)
+            self.signals.progress.emit(10)
             
             # Validate file before upload
             if not self._validate_csv():
-                self.error.emit('Invalid CSV format. Please check required columns.')
+                self.signals.error.emit('Invalid CSV format. Please check required columns.')
                 return
             
-            self.progress.emit(30)
-            
             with open(self.file_path, 'rb') as f:
-                files = {'file': f}
-                response = requests.post(
+                # Stream the multipart body from disk instead of building it
+                # in memory, reporting real byte progress in the 30-70% range
+                encoder = MultipartEncoder(
+                    fields={'file': (os.path.basename(self.file_path), f, 'text/csv')}
+                )
+                monitor = MultipartEncoderMonitor(encoder, self._on_bytes_sent)
+                response = self.session.post(
                     f'{self.api_url}/datasets/upload/',
-                    files=files,
+                    data=monitor,
+                    headers={'Content-Type': monitor.content_type},
                     timeout=self.timeout
                 )
             
-            self.progress.emit(70)
-            
             if response.status_code == 201:
                 data = response.json()
-                self.progress.emit(100)
+                self.signals.progress.emit(100)
                 logger.info(f'Upload successful: {data.get("id")}')
-                self.finished.emit(data)
+                self.signals.finished.emit(data)
             else:
                 error_data = response.json() if response.headers.get('content-type') == 'application/json' else {}
                 error_msg = error_data.get('error', f'Upload failed with status {response.status_code}')
                 logger.error(f'Upload failed: {error_msg}')
-                self.error.emit(error_msg)
+                self.signals.error.emit(error_msg)
                 
         except requests.exceptions.ConnectionError:
             error_msg = f'Cannot connect to server at {self.api_url}'
             logger.error(error_msg)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
         except requests.exceptions.Timeout:
             error_msg = 'Request timed out. Please try again.'
             logger.error(error_msg)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
         except Exception as e:
             error_msg = f'Unexpected error: {str(e)}'
             logger.error(error_msg, exc_info=True)
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
+    
+    def _on_bytes_sent(self, monitor: MultipartEncoderMonitor):
+        """Emit upload progress as the request body is read"""
+        percent = 30 + int(40 * monitor.bytes_read / monitor.len) if monitor.len else 70
+        if percent == self._last_progress:
+            return
+        
+        # Each emit is a cross-thread post plus a progress bar repaint, so
+        # throttle them; the final value for the body is always sent
+        now = time.monotonic()
+        if percent == 70 or now - self._last_progress_time >= PROGRESS_MIN_INTERVAL:
+            self._last_progress = percent
+            self._last_progress_time = now
+            self.signals.progress.emit(percent)
     
     def _validate_csv(self) -> bool:
-        """Validate CSV file structure"""
+        """Validate CSV file structure from its header and first data line"""
         try:
-            with open(self.file_path, 'r') as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames
-                
-                if not headers:
-                    return False
-                
-                # Check for required columns
-                for required in REQUIRED_COLUMNS:
-                    if required not in headers:
-                        logger.error(f'Missing required column: {required}')
-                        return False
-                
-                # Validate at least one row exists
-                first_row = next(reader, None)
-                if not first_row:
-                    logger.error('CSV file is empty')
-                    return False
-                
-                return True
+            if os.path.getsize(self.file_path) > MAX_FILE_SIZE_MB * 1024 * 1024:
+                logger.error(f'File exceeds {MAX_FILE_SIZE_MB}MB limit')
+                return False
+            
+            with open(self.file_path, 'r', newline='') as f:
+                header_line = f.readline()
+                first_line = f.readline()
+            
+            headers = set(next(csv.reader([header_line]), []))
+            if not headers:
+                return False
+            
+            # Check for required columns
+            missing = REQUIRED_COLUMNS_SET - headers
+            if missing:
+                logger.error(f'Missing required columns: {", ".join(sorted(missing))}')
+                return False
+            
+            # Validate at least one row exists
+            if not first_line.strip():
+                logger.error('CSV file is empty')
+                return False
+            
+            return True
                 
         except Exception as e:
             logger.error(f'CSV validation error: {e}')
             return False
 
 
+class RequestSignals(QObject):
+    """Signals emitted by RequestTask"""
+    
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+
+
+class RequestTask(QRunnable):
+    """Single HTTP request run on the shared thread pool"""
+    
+    def __init__(self, session: requests.Session, method: str, url: str, **kwargs):
+        super().__init__()
+        self.signals = RequestSignals()
+        self.session = session
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+    
+    def run(self):
+        try:
+            response = self.session.request(self.method, self.url, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(response)
+
+
+class DownloadSignals(QObject):
+    """Signals emitted by DownloadTask"""
+    
+    finished = pyqtSignal(str)
+    error = pyqtSignal(object)
+    progress = pyqtSignal(int)
+
+
+class DownloadTask(QRunnable):
+    """Stream a file download to disk on the shared thread pool"""
+    
+    def __init__(self, session: requests.Session, url: str, filename: str, timeout: int):
+        super().__init__()
+        self.signals = DownloadSignals()
+        self.session = session
+        self.url = url
+        self.filename = filename
+        self.timeout = timeout
+    
+    def run(self):
+        try:
+            with self.session.get(self.url, stream=True, timeout=self.timeout) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Server returned status {response.status_code}")
+                self._save(response)
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(self.filename)
+    
+    def _save(self, response: requests.Response):
+        """Write the response body in chunks, reporting whole-percent progress"""
+        total = int(response.headers.get('Content-Length') or 0)
+        written = 0
+        last_percent = -1
+        
+        try:
+            with open(self.filename, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+                    
+                    if total:
+                        percent = min(written * 100 // total, 100)
+                        if percent != last_percent:
+                            last_percent = percent
+                            self.signals.progress.emit(percent)
+        except Exception:
+            # Do not leave a truncated report behind
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+            raise
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints Load/Delete buttons in a table cell and reports clicks on them"""
+    
+    load_requested = pyqtSignal(int)
+    delete_requested = pyqtSignal(int)
+    
+    # (label, color, hover color) for the Load and Delete buttons
+    BUTTONS = (
+        ('📂 Load', '#10B981', '#059669'),
+        ('🗑️ Delete', '#EF4444', '#DC2626'),
+    )
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.button_font = QFont('Arial', 8, QFont.Bold)
+    
+    def _button_rects(self, rect: QRect):
+        """Split a cell into the Load and Delete button areas"""
+        inner = rect.adjusted(3, 4, -3, -4)
+        width = (inner.width() - 3) // 2
+        load_rect = QRect(inner.left(), inner.top(), width, inner.height())
+        delete_rect = QRect(load_rect.right() + 4, inner.top(), width, inner.height())
+        return load_rect, delete_rect
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self.button_font)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        
+        for rect, (label, color, hover_color) in zip(self._button_rects(option.rect), self.BUTTONS):
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(hover_color if hovered else color))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(QColor('white'))
+            painter.drawText(rect, Qt.AlignCenter, label)
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        return QSize(150, 40)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            dataset_id = index.data(Qt.UserRole)
+            load_rect, delete_rect = self._button_rects(option.rect)
+            if load_rect.contains(event.pos()):
+                self.load_requested.emit(dataset_id)
+                return True
+            if delete_rect.contains(event.pos()):
+                self.delete_requested.emit(dataset_id)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class EquipmentTableModel(QAbstractTableModel):
+    """Read-only table model serving equipment record dicts on demand"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Cells are produced only for the rows the view paints; Qt.UserRole
+        # returns the raw value for sorting, Qt.DisplayRole the formatted text
+        self._records: List[Dict] = []
+    
+    def set_records(self, records: List[Dict]):
+        """Replace the records shown by the model"""
+        self.beginResetModel()
+        self._records = records
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(TABLE_FIELDS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole and role != Qt.UserRole:
+            return None
+        
+        column = index.column()
+        record = self._records[index.row()]
+        # Values arrive from JSON as str and float already, so they are
+        # used as-is rather than passed through str()/float() per cell
+        if column < len(TABLE_TEXT_FIELDS):
+            return record.get(TABLE_FIELDS[column], '')
+        
+        value = record.get(TABLE_FIELDS[column], 0)
+        return '%.2f' % value if role == Qt.DisplayRole else value
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return TABLE_HEADERS[section]
+        return section + 1
+
+
 class MatplotlibWidget(QWidget):
     """Enhanced widget to embed matplotlib figures with better styling"""
     
+    # matplotlib is imported by the first widget, keeping it off the startup path
+    _plt = None
+    _Figure = None
+    _FigureCanvas = None
+    _viridis = None
+    _set3 = None
+    
+    @classmethod
+    def _load_matplotlib(cls):
+        """Import matplotlib once and cache the pieces the charts use"""
+        if cls._plt is not None:
+            return
+        
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure
+        import matplotlib.pyplot as plt
+        
+        # Set matplotlib style
+        plt.style.use('seaborn-v0_8-darkgrid')
+        
+        cls._Figure = Figure
+        cls._FigureCanvas = FigureCanvasQTAgg
+        # Colormaps resolved once instead of through the plt.cm registry per redraw
+        cls._viridis = plt.cm.viridis
+        cls._set3 = plt.cm.Set3
+        cls._plt = plt
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
+        self._load_matplotlib()
+        # Constrained layout runs as part of each draw instead of a separate
+        # tight_layout() measuring pass per chart
+        self.figure = self._Figure(figsize=(8, 6), dpi=100, layout='constrained')
+        self.canvas = self._FigureCanvas(self.figure)
+        # A single Axes is reused across chart switches instead of being
+        # recreated (with all its spines and ticks) on every redraw
+        self.ax = self.figure.add_subplot(111)
+        # (3, 3) min/avg/max array for the summary dict it was built from
+        self._summary_source: Optional[Dict] = None
+        self._summary_array: Optional[np.ndarray] = None
+        # Min/avg/max bar containers while the comparison chart is on the Axes
+        self._multibar_bars: Optional[tuple] = None
         
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
-        
-        # Set matplotlib style
-        plt.style.use('seaborn-v0_8-darkgrid')
+    
+    @contextmanager
+    def _redraw(self):
+        """Rebuild the chart with repaints suspended, then draw it once"""
+        self.canvas.setUpdatesEnabled(False)
+        try:
+            self.ax.clear()
+            self._multibar_bars = None
+            # clear() keeps the aspect ratio, which the pie chart sets to equal
+            self.ax.set_aspect('auto')
+            yield self.ax
+        finally:
+            self.canvas.setUpdatesEnabled(True)
+            self.canvas.draw_idle()
+    
+    def plot_message(self, message: str, fontsize: int = 14, **text_kwargs):
+        """Replace the chart with a centered message"""
+        with self._redraw() as ax:
+            ax.text(0.5, 0.5, message,
+                   ha='center', va='center', fontsize=fontsize, transform=ax.transAxes,
+                   **text_kwargs)
+            ax.axis('off')
     
     def plot_bar_chart(self, data_dict: Dict, title: str, xlabel: str, ylabel: str):
         """Create an enhanced bar chart"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         if not data_dict:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=14, transform=ax.transAxes)
-            ax.axis('off')
-            self.canvas.draw()
+            self.plot_message('No data available')
             return
         
-        keys = list(data_dict.keys())
-        values = list(data_dict.values())
-        
-        colors = plt.cm.viridis(range(len(keys)))
-        bars = ax.bar(keys, values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
-        
-        ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
-        ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-        self.figure.tight_layout()
-        self.canvas.draw()
+        with self._redraw() as ax:
+            keys, values = zip(*data_dict.items())
+            values = np.asarray(values, dtype=np.float64)
+            
+            colors = self._viridis(np.linspace(0, 1, len(keys)))
+            bars = ax.bar(keys, values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.5)
+            
+            ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+            ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+            
+            # Add value labels on bars
+            ax.bar_label(bars, labels=[f'{int(v)}' for v in values],
+                         padding=2, fontsize=10, fontweight='bold')
+            
+            self._plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+    
+    def _summary_stats(self, summary: Dict) -> np.ndarray:
+        """Return min/avg/max rows for the summary, built once per summary dict"""
+        if summary is not self._summary_source:
+            self._summary_array = np.array(
+                [[summary.get(key, 0) for key in row] for row in SUMMARY_STAT_KEYS],
+                dtype=np.float64
+            )
+            self._summary_source = summary
+        return self._summary_array
     
     def plot_multi_bar_chart(self, summary: Dict, title: str):
         """Create enhanced grouped bar chart for parameter comparison"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         if not summary:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=14, transform=ax.transAxes)
-            ax.axis('off')
-            self.canvas.draw()
+            self.plot_message('No data available')
             return
         
-        parameters = ['Flowrate', 'Pressure', 'Temperature']
-        min_values = [
-            summary.get('min_flowrate', 0),
-            summary.get('min_pressure', 0),
-            summary.get('min_temperature', 0)
-        ]
-        avg_values = [
-            summary.get('avg_flowrate', 0),
-            summary.get('avg_pressure', 0),
-            summary.get('avg_temperature', 0)
-        ]
-        max_values = [
-            summary.get('max_flowrate', 0),
-            summary.get('max_pressure', 0),
-            summary.get('max_temperature', 0)
-        ]
-        
-        x = range(len(parameters))
-        width = 0.25
-        
-        ax.bar([i - width for i in x], min_values, width, label='Min', 
-               color='#EF4444', alpha=0.8, edgecolor='black')
-        ax.bar(x, avg_values, width, label='Average', 
-               color='#3B82F6', alpha=0.8, edgecolor='black')
-        ax.bar([i + width for i in x], max_values, width, label='Max', 
-               color='#10B981', alpha=0.8, edgecolor='black')
-        
-        ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Values', fontsize=12, fontweight='bold')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        ax.set_xticks(x)
-        ax.set_xticklabels(parameters)
-        ax.legend(loc='upper left', fontsize=10)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        stats = self._summary_stats(summary)
+        
+        if self._multibar_bars is not None:
+            # Chart already built: move the existing bars rather than
+            # recreating bars, tick labels and legend
+            for bars, heights in zip(self._multibar_bars, stats):
+                for rect, height in zip(bars, heights):
+                    rect.set_height(height)
+            self.ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.canvas.draw_idle()
+            return
         
-        self.figure.tight_layout()
-        self.canvas.draw()
+        with self._redraw() as ax:
+            min_values, avg_values, max_values = stats
+            width = 0.25
+            
+            min_bars = ax.bar(_PARAM_X - width, min_values, width, label='Min', 
+                              color='#EF4444', alpha=0.8, edgecolor='black')
+            avg_bars = ax.bar(_PARAM_X, avg_values, width, label='Average', 
+                              color='#3B82F6', alpha=0.8, edgecolor='black')
+            max_bars = ax.bar(_PARAM_X + width, max_values, width, label='Max', 
+                              color='#10B981', alpha=0.8, edgecolor='black')
+            
+            ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Values', fontsize=12, fontweight='bold')
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            ax.set_xticks(_PARAM_X)
+            ax.set_xticklabels(SUMMARY_PARAMETERS)
+            ax.legend(loc='upper left', fontsize=10)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+            
+            self._multibar_bars = (min_bars, avg_bars, max_bars)
     
     def plot_pie_chart(self, data_dict: Dict, title: str):
         """Create an enhanced pie chart"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         if not data_dict:
-            ax.text(0.5, 0.5, 'No data available', 
-                   ha='center', va='center', fontsize=14, transform=ax.transAxes)
-            ax.axis('off')
-            self.canvas.draw()
+            self.plot_message('No data available')
             return
         
-        keys = list(data_dict.keys())
-        values = list(data_dict.values())
-        
-        colors = plt.cm.Set3(range(len(keys)))
-        wedges, texts, autotexts = ax.pie(
-            values, 
-            labels=keys, 
-            autopct='%1.1f%%',
-            colors=colors,
-            startangle=90,
-            textprops={'fontsize': 10},
-            explode=[0.05] * len(keys)  # Slight separation
-        )
-        
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        
-        # Style percentage text
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
-            autotext.set_fontsize(11)
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
+        with self._redraw() as ax:
+            keys, values = zip(*data_dict.items())
+            values = np.asarray(values, dtype=np.float64)
+            
+            colors = self._set3(np.arange(len(keys)))
+            wedges, texts, autotexts = ax.pie(
+                values, 
+                labels=keys, 
+                autopct='%1.1f%%',
+                colors=colors,
+                startangle=90,
+                textprops={'fontsize': 10},
+                explode=[0.05] * len(keys)  # Slight separation
+            )
+            
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            
+            # Style percentage text
+            for autotext in autotexts:
+                autotext.set_color('white')
+                autotext.set_fontweight('bold')
+                autotext.set_fontsize(11)
 
 
 class ChemicalEquipmentApp(QMainWindow):
@@ -344,9 +693,18 @@ class ChemicalEquipmentApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = Config()
+        self.session = create_http_session()
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(BACKGROUND_POOL_SIZE)
+        self.refresh_pending = False
+        self.reload_requested = False
+        self.pending_deletes = 0
+        self.deleted_count = 0
         self.current_dataset: Optional[Dict] = None
         self.datasets_list: List[Dict] = []
         self.selected_file_path: Optional[str] = None
+        self.datasets_etag: Optional[str] = None
+        self._dirty = {'dashboard': True, 'table': True, 'chart': True}
         
         self.init_ui()
         self.load_datasets()
@@ -354,7 +712,7 @@ class ChemicalEquipmentApp(QMainWindow):
         # Auto-refresh timer
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.auto_refresh_datasets)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        # Started only while the History tab is visible, see on_tab_changed
     
     def init_ui(self):
         """Initialize the enhanced user interface"""
@@ -409,10 +767,40 @@ class ChemicalEquipmentApp(QMainWindow):
     
     def on_tab_changed(self, index):
         """Handle tab change event"""
-        # Update data table when switching to Data Table tab (index 3)
-        if index == 3:
-            logger.info('Switched to Data Table tab, refreshing table')
-            self.update_table()
+        # Build the chart on first visit to the Visualizations tab (index 2)
+        if index == 2 and self.chart_widget is None:
+            logger.info('Switched to Visualizations tab, loading charts')
+            self.chart_widget = MatplotlibWidget()
+            self.chart_layout.addWidget(self.chart_widget)
+            self._dirty['chart'] = True
+        
+        # Refresh the newly shown view if its data changed while hidden
+        self._refresh_current_tab()
+        
+        # Only poll for new datasets while the History tab (index 4) is shown
+        self.update_refresh_timer()
+    
+    def _mark_views_dirty(self):
+        """Flag all dataset views stale and refresh only the visible one"""
+        for view in self._dirty:
+            self._dirty[view] = True
+        self._refresh_current_tab()
+    
+    def _refresh_current_tab(self):
+        """Update the visible dataset view if it is stale"""
+        view = TAB_VIEWS.get(self.tabs.currentIndex())
+        if view is None or not self._dirty[view]:
+            return
+        self._dirty[view] = False
+        getattr(self, f'update_{view}')()
+    
+    def update_refresh_timer(self):
+        """Run the auto-refresh timer only when it is enabled and History is visible"""
+        if self.tabs.currentIndex() == 4 and self.auto_refresh_checkbox.isChecked():
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        else:
+            self.refresh_timer.stop()
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -613,8 +1001,8 @@ class ChemicalEquipmentApp(QMainWindow):
         summary_group.setFont(QFont('Arial', 11, QFont.Bold))
         summary_layout = QGridLayout(summary_group)
         
-        # Create stat cards
-        self.stat_cards = {}
+        # Create stat cards, keeping their value labels for update_dashboard
+        self.stat_value_labels: Dict[str, QLabel] = {}
         stat_items = [
             ('total_count', 'Total Records', '#3B82F6', '📊'),
             ('avg_flowrate', 'Avg Flowrate', '#10B981', '💧'),
@@ -624,7 +1012,7 @@ class ChemicalEquipmentApp(QMainWindow):
         
         for i, (key, label, color, icon) in enumerate(stat_items):
             card = self.create_stat_card(label, '0', color, icon)
-            self.stat_cards[key] = card
+            self.stat_value_labels[key] = card.value_label
             row = i // 2
             col = i % 2
             summary_layout.addWidget(card, row, col)
@@ -728,9 +1116,11 @@ class ChemicalEquipmentApp(QMainWindow):
         
         layout.addLayout(selector_layout)
         
-        # Matplotlib widget
-        self.chart_widget = MatplotlibWidget()
-        layout.addWidget(self.chart_widget)
+        # Matplotlib widget, created when the tab is first shown
+        self.chart_layout = layout
+        self.chart_widget: Optional[MatplotlibWidget] = None
+        # (chart type, summary) last drawn, so identical updates skip matplotlib
+        self.last_chart_key = None
         
         return tab
     
@@ -756,22 +1146,38 @@ class ChemicalEquipmentApp(QMainWindow):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText('Filter records...')
         self.search_box.setMaximumWidth(200)
-        self.search_box.textChanged.connect(self.filter_table)
         controls_layout.addWidget(self.search_box)
         
         layout.addLayout(controls_layout)
         
-        # Table widget
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels([
-            'Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature'
-        ])
+        # Records live in a model behind a proxy that filters and sorts in C++;
+        # the search box matches its text against every column
+        self.data_model = EquipmentTableModel()
+        self.data_proxy = QSortFilterProxyModel()
+        self.data_proxy.setSourceModel(self.data_model)
+        self.data_proxy.setSortRole(Qt.UserRole)
+        self.data_proxy.setFilterKeyColumn(-1)
+        self.data_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        # Debounced so a burst of keystrokes filters once, after typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(
+            lambda: self.data_proxy.setFilterFixedString(self.search_box.text())
+        )
+        self.search_box.textChanged.connect(self.search_timer.start)
+        
+        # Table view
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_proxy)
         self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights: the view never measures row contents
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(28)
         self.data_table.setAlternatingRowColors(True)
         self.data_table.setSortingEnabled(True)
         self.data_table.setStyleSheet('''
-            QTableWidget {
+            QTableView {
                 gridline-color: #D1D5DB;
                 background-color: white;
                 border: 1px solid #D1D5DB;
@@ -784,7 +1190,7 @@ class ChemicalEquipmentApp(QMainWindow):
                 font-weight: bold;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #DBEAFE;
                 color: #1E40AF;
             }
@@ -855,22 +1261,18 @@ class ChemicalEquipmentApp(QMainWindow):
         self.history_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.history_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setRowHeight(0, 45)
-        self.history_table.setStyleSheet('''
-            QTableWidget {
-                gridline-color: #D1D5DB;
-                background-color: white;
-                border: 1px solid #D1D5DB;
-                border-radius: 5px;
-            }
-            QHeaderView::section {
-                background-color: #8B5CF6;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border: none;
-            }
-        ''')
+        self.history_table.verticalHeader().setDefaultSectionSize(45)
+        self.history_table.setStyleSheet(HISTORY_TABLE_QSS)
+        # Action buttons are painted by a delegate rather than created as
+        # widgets for every row on each refresh
+        self.history_table.setMouseTracking(True)
+        self.history_actions = ActionButtonDelegate(self.history_table)
+        self.history_actions.load_requested.connect(self.load_dataset_details)
+        self.history_actions.delete_requested.connect(self.delete_dataset)
+        self.history_table.setItemDelegateForColumn(3, self.history_actions)
+        # Sortable by header click; newest uploads first, as the API returns them
+        self.history_table.horizontalHeader().setSortIndicator(1, Qt.DescendingOrder)
+        self.history_table.setSortingEnabled(True)
         
         layout.addWidget(self.history_table)
         
@@ -914,10 +1316,13 @@ class ChemicalEquipmentApp(QMainWindow):
         value_label.setObjectName('value_label')
         
         layout.addWidget(value_label)
+        card.value_label = value_label
         
         return card
     
-    def adjust_color(self, hex_color: str, adjustment: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def adjust_color(hex_color: str, adjustment: int) -> str:
         """Adjust color brightness"""
         hex_color = hex_color.lstrip('#')
         r, g, b = int(hex_color[:2], 16), int(hex_color[2:4], 16), int(hex_color[4:], 16)
@@ -979,11 +1384,11 @@ class ChemicalEquipmentApp(QMainWindow):
         api_url = self.config.get_api_url()
         timeout = self.config.get_api_timeout()
         
-        self.upload_thread = UploadThread(self.selected_file_path, api_url, timeout)
-        self.upload_thread.finished.connect(self.on_upload_success)
-        self.upload_thread.error.connect(self.on_upload_error)
-        self.upload_thread.progress.connect(self.progress_bar.setValue)
-        self.upload_thread.start()
+        upload_task = UploadTask(self.selected_file_path, api_url, timeout, self.session)
+        upload_task.signals.finished.connect(self.on_upload_success)
+        upload_task.signals.error.connect(self.on_upload_error)
+        upload_task.signals.progress.connect(self.progress_bar.setValue)
+        self.thread_pool.start(upload_task)
     
     def on_upload_success(self, data: Dict):
         """Handle successful upload"""
@@ -992,22 +1397,12 @@ class ChemicalEquipmentApp(QMainWindow):
         
         # Show success message
         self.upload_status_label.setText('✓ File uploaded and processed successfully!')
-        self.upload_status_label.setStyleSheet('''
-            padding: 12px;
-            border-radius: 8px;
-            margin-top: 10px;
-            background-color: #DCFCE7;
-            border: 2px solid #22C55E;
-            color: #166534;
-            font-weight: bold;
-        ''')
+        self.upload_status_label.setStyleSheet(UPLOAD_SUCCESS_QSS)
         self.upload_status_label.setVisible(True)
         
         self.current_dataset = data
         self.load_datasets()
-        self.update_dashboard()
-        self.update_table()
-        self.update_chart()
+        self._mark_views_dirty()
         self.tabs.setCurrentIndex(1)  # Switch to dashboard
         
         self.statusBar().showMessage('✓ Upload completed successfully')
@@ -1023,33 +1418,62 @@ class ChemicalEquipmentApp(QMainWindow):
         
         # Show error message
         self.upload_status_label.setText(f'✗ Error: {error_msg}')
-        self.upload_status_label.setStyleSheet('''
-            padding: 12px;
-            border-radius: 8px;
-            margin-top: 10px;
-            background-color: #FEE2E2;
-            border: 2px solid #EF4444;
-            color: #991B1B;
-            font-weight: bold;
-        ''')
+        self.upload_status_label.setStyleSheet(UPLOAD_ERROR_QSS)
         self.upload_status_label.setVisible(True)
         
         self.statusBar().showMessage('✗ Upload failed')
         logger.error(f'Upload failed: {error_msg}')
     
     def load_datasets(self):
-        """Load list of datasets from API"""
+        """Load list of datasets from API in the background"""
+        self.request_datasets(conditional=False)
+    
+    def request_datasets(self, conditional: bool):
+        """
+        Fetch the dataset list on the thread pool
+        
+        With conditional=True the last ETag is sent, so an unchanged list comes
+        back as an empty 304. While a request is in flight a new one is not
+        started; an explicit load instead re-runs once the current one answers.
+        """
+        if self.refresh_pending:
+            if not conditional:
+                self.reload_requested = True
+            return
+        
+        api_url = self.config.get_api_url()
+        timeout = self.config.get_api_timeout()
+        
+        headers = {}
+        if conditional and self.datasets_etag:
+            headers['If-None-Match'] = self.datasets_etag
+        
+        logger.info(f"Loading datasets from {api_url}/datasets/")
+        task = RequestTask(
+            self.session, 'GET', f'{api_url}/datasets/',
+            headers=headers, timeout=timeout
+        )
+        task.signals.finished.connect(self.on_datasets_loaded)
+        task.signals.error.connect(self.on_datasets_error)
+        self.refresh_pending = True
+        self.thread_pool.start(task)
+    
+    def on_datasets_loaded(self, response: requests.Response):
+        """Apply a dataset list response to the history, dashboard, table and chart"""
+        self.refresh_pending = False
+        if self._reload_if_requested():
+            return
+        
         try:
-            api_url = self.config.get_api_url()
-            timeout = self.config.get_api_timeout()
+            logger.debug("API Response Status: %s", response.status_code)
             
-            logger.info(f"Loading datasets from {api_url}/datasets/")
-            response = requests.get(f'{api_url}/datasets/', timeout=timeout)
-            logger.debug(f"API Response Status: {response.status_code}")
+            if response.status_code == 304:
+                logger.debug("Datasets unchanged since last load")
+                return
             
             if response.status_code == 200:
+                self.datasets_etag = response.headers.get('ETag')
                 data = response.json()
-                logger.debug(f"API Response Data: {data}")
                 
                 # Handle both single object and list responses
                 if isinstance(data, dict) and 'id' in data:
@@ -1057,7 +1481,7 @@ class ChemicalEquipmentApp(QMainWindow):
                     logger.debug("Wrapped single object into list")
                 elif isinstance(data, list):
                     self.datasets_list = data
-                    logger.debug(f"Data is a list with {len(data)} items")
+                    logger.debug("Data is a list with %d items", len(data))
                 else:
                     self.datasets_list = []
                     logger.warning("Unexpected data format")
@@ -1067,16 +1491,11 @@ class ChemicalEquipmentApp(QMainWindow):
                 # Auto-load latest dataset
                 if self.datasets_list:
                     self.current_dataset = self.datasets_list[0]
-                    logger.debug(f"Setting current dataset: {self.current_dataset.get('id', 'Unknown')}")
-                    self.update_dashboard()
-                    self.update_table()
-                    self.update_chart()
+                    logger.debug("Setting current dataset: %s", self.current_dataset.get('id', 'Unknown'))
                 else:
                     logger.warning("No datasets available")
                     self.current_dataset = None
-                    self.update_dashboard()
-                    self.update_table()
-                    self.update_chart()
+                self._mark_views_dirty()
                 
                 self.statusBar().showMessage(f'✓ Loaded {len(self.datasets_list)} dataset(s)')
                 
@@ -1085,46 +1504,70 @@ class ChemicalEquipmentApp(QMainWindow):
                 self.datasets_list = []
                 self.statusBar().showMessage(f'✗ API error: {response.status_code}')
                 
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error: {e}")
-            self.statusBar().showMessage('✗ Cannot connect to server')
-            self.datasets_list = []
-        except requests.exceptions.Timeout as e:
-            logger.error(f"Timeout error: {e}")
-            self.statusBar().showMessage('✗ Request timed out')
-            self.datasets_list = []
         except Exception as e:
             logger.error(f'Error loading datasets: {e}', exc_info=True)
             self.statusBar().showMessage('✗ Error loading datasets')
             self.datasets_list = []
     
+    def on_datasets_error(self, error: Exception):
+        """Handle a failed dataset list request"""
+        self.refresh_pending = False
+        if self._reload_if_requested():
+            return
+        
+        if isinstance(error, requests.exceptions.ConnectionError):
+            logger.error(f"Connection error: {error}")
+            self.statusBar().showMessage('✗ Cannot connect to server')
+        elif isinstance(error, requests.exceptions.Timeout):
+            logger.error(f"Timeout error: {error}")
+            self.statusBar().showMessage('✗ Request timed out')
+        else:
+            logger.error(f'Error loading datasets: {error}', exc_info=error)
+            self.statusBar().showMessage('✗ Error loading datasets')
+        self.datasets_list = []
+    
+    def _reload_if_requested(self) -> bool:
+        """Start a fresh load if one was asked for while a request was in flight"""
+        if not self.reload_requested:
+            return False
+        self.reload_requested = False
+        self.request_datasets(conditional=False)
+        return True
+    
     def auto_refresh_datasets(self):
         """Auto-refresh datasets if enabled"""
         if self.auto_refresh_checkbox.isChecked():
-            self.load_datasets()
+            self.request_datasets(conditional=True)
     
     def toggle_auto_refresh(self, state):
         """Toggle auto-refresh timer"""
+        self.update_refresh_timer()
         if state == Qt.Checked:
-            self.refresh_timer.start(30000)
             logger.info('Auto-refresh enabled')
         else:
-            self.refresh_timer.stop()
             logger.info('Auto-refresh disabled')
     
     def load_dataset_details(self, dataset_id: int):
-        """Load detailed dataset information"""
+        """Load detailed dataset information in the background"""
+        api_url = self.config.get_api_url()
+        timeout = self.config.get_api_timeout()
+        
+        self.statusBar().showMessage(f'Loading dataset {dataset_id}...')
+        task = RequestTask(
+            self.session, 'GET', f'{api_url}/datasets/{dataset_id}/',
+            timeout=timeout
+        )
+        task.signals.finished.connect(self.on_dataset_details_loaded)
+        task.signals.error.connect(self.on_dataset_details_error)
+        self.thread_pool.start(task)
+    
+    def on_dataset_details_loaded(self, response: requests.Response):
+        """Show a dataset fetched by load_dataset_details"""
         try:
-            api_url = self.config.get_api_url()
-            timeout = self.config.get_api_timeout()
-            
-            response = requests.get(f'{api_url}/datasets/{dataset_id}/', timeout=timeout)
-            
             if response.status_code == 200:
                 self.current_dataset = response.json()
-                self.update_dashboard()
-                self.update_table()
-                self.update_chart()
+                dataset_id = self.current_dataset.get('id')
+                self._mark_views_dirty()
                 self.tabs.setCurrentIndex(1)  # Switch to dashboard
                 self.statusBar().showMessage(f'✓ Loaded dataset {dataset_id}')
                 logger.info(f'Loaded dataset details: {dataset_id}')
@@ -1132,8 +1575,12 @@ class ChemicalEquipmentApp(QMainWindow):
                 QMessageBox.warning(self, 'Error', f'Failed to load dataset: {response.status_code}')
                 
         except Exception as e:
-            logger.error(f'Error loading dataset details: {e}', exc_info=True)
-            QMessageBox.critical(self, 'Error', f'Failed to load dataset:\n{str(e)}')
+            self.on_dataset_details_error(e)
+    
+    def on_dataset_details_error(self, error: Exception):
+        """Handle a failed dataset detail request"""
+        logger.error(f'Error loading dataset details: {error}', exc_info=error)
+        QMessageBox.critical(self, 'Error', f'Failed to load dataset:\n{str(error)}')
     
     def update_dashboard(self):
         """Update dashboard with current dataset"""
@@ -1143,11 +1590,8 @@ class ChemicalEquipmentApp(QMainWindow):
             self.ranges_text.setText('No data available.\n\nUpload a CSV file to see parameter ranges and statistics.')
             
             # Reset stat cards
-            for key in self.stat_cards:
-                card = self.stat_cards[key]
-                value_label = card.findChild(QLabel, 'value_label')
-                if value_label:
-                    value_label.setText('0')
+            for value_label in self.stat_value_labels.values():
+                value_label.setText('0')
             
             self.download_pdf_btn.setEnabled(False)
             return
@@ -1157,12 +1601,9 @@ class ChemicalEquipmentApp(QMainWindow):
         upload_date = self.current_dataset.get('uploaded_at', '')
         
         if upload_date:
-            try:
-                upload_date = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
-                upload_date = upload_date.strftime('%Y-%m-%d %H:%M:%S')
-            except Exception as e:
-                logger.warning(f"Failed to parse date: {e}")
-                upload_date = 'Unknown'
+            upload_date = format_timestamp(upload_date, 'yyyy-MM-dd HH:mm:ss')
+            if upload_date == 'Unknown':
+                logger.warning(f"Failed to parse date: {self.current_dataset.get('uploaded_at')}")
         
         self.dataset_info_label.setText(
             f'📊 <b>Dataset:</b> {filename} | <b>Uploaded:</b> {upload_date}'
@@ -1170,7 +1611,7 @@ class ChemicalEquipmentApp(QMainWindow):
         
         # Update stat cards
         summary = self.current_dataset.get('summary', {})
-        logger.debug(f"Summary data: {summary}")
+        logger.debug("Summary data: %s", summary)
         
         stats = {
             'total_count': str(summary.get('total_count', 0)),
@@ -1180,32 +1621,22 @@ class ChemicalEquipmentApp(QMainWindow):
         }
         
         for key, value in stats.items():
-            card = self.stat_cards[key]
-            value_label = card.findChild(QLabel, 'value_label')
-            if value_label:
-                value_label.setText(value)
+            self.stat_value_labels[key].setText(value)
         
         # Update parameter ranges
-        ranges_text = "=" * 50 + "\n"
-        ranges_text += "PARAMETER RANGES SUMMARY\n"
-        ranges_text += "=" * 50 + "\n\n"
-        
-        ranges_text += f"Flowrate:\n"
-        ranges_text += f"  Minimum    : {summary.get('min_flowrate', 0):>10.2f}\n"
-        ranges_text += f"  Average    : {summary.get('avg_flowrate', 0):>10.2f}\n"
-        ranges_text += f"  Maximum    : {summary.get('max_flowrate', 0):>10.2f}\n\n"
-        
-        ranges_text += f"Pressure:\n"
-        ranges_text += f"  Minimum    : {summary.get('min_pressure', 0):>10.2f}\n"
-        ranges_text += f"  Average    : {summary.get('avg_pressure', 0):>10.2f}\n"
-        ranges_text += f"  Maximum    : {summary.get('max_pressure', 0):>10.2f}\n\n"
-        
-        ranges_text += f"Temperature:\n"
-        ranges_text += f"  Minimum    : {summary.get('min_temperature', 0):>10.2f}\n"
-        ranges_text += f"  Average    : {summary.get('avg_temperature', 0):>10.2f}\n"
-        ranges_text += f"  Maximum    : {summary.get('max_temperature', 0):>10.2f}\n"
-        
-        ranges_text += "\n" + "=" * 50
+        rule = "=" * 50
+        lines = [rule, "PARAMETER RANGES SUMMARY", rule, ""]
+        for param in SUMMARY_PARAMETERS:
+            key = param.lower()
+            lines += [
+                f"{param}:",
+                f"  Minimum    : {summary.get(f'min_{key}', 0):>10.2f}",
+                f"  Average    : {summary.get(f'avg_{key}', 0):>10.2f}",
+                f"  Maximum    : {summary.get(f'max_{key}', 0):>10.2f}",
+                "",
+            ]
+        lines.append(rule)
+        ranges_text = "\n".join(lines)
         
         self.ranges_text.setText(ranges_text)
         
@@ -1216,71 +1647,47 @@ class ChemicalEquipmentApp(QMainWindow):
         logger.info('Updating data table')
         
         if not self.current_dataset:
-            self.data_table.setRowCount(0)
+            self.data_model.set_records([])
             self.table_info_label.setText('Equipment Records (0 total)')
             logger.debug('No current dataset, table cleared')
             return
         
         equipment_records = self.current_dataset.get('equipment_records', [])
-        logger.debug(f'Found {len(equipment_records)} equipment records')
-        logger.debug(f'Equipment records data: {equipment_records}')
+        logger.debug('Found %d equipment records', len(equipment_records))
         
-        self.data_table.setRowCount(len(equipment_records))
-        
-        for row, equipment in enumerate(equipment_records):
-            logger.debug(f'Processing row {row}: {equipment}')
-            self.data_table.setItem(row, 0, QTableWidgetItem(str(equipment.get('equipment_name', ''))))
-            self.data_table.setItem(row, 1, QTableWidgetItem(str(equipment.get('equipment_type', ''))))
-            self.data_table.setItem(row, 2, QTableWidgetItem(f"{float(equipment.get('flowrate', 0)):.2f}"))
-            self.data_table.setItem(row, 3, QTableWidgetItem(f"{float(equipment.get('pressure', 0)):.2f}"))
-            self.data_table.setItem(row, 4, QTableWidgetItem(f"{float(equipment.get('temperature', 0)):.2f}"))
+        # A single model reset; the proxy re-sorts and re-filters once
+        self.data_model.set_records(equipment_records)
         
         self.table_info_label.setText(f'Equipment Records ({len(equipment_records)} total)')
         logger.info(f'Data table updated with {len(equipment_records)} records')
-        
-        # Force table to refresh and display
-        self.data_table.resizeRowsToContents()
-        self.data_table.viewport().update()
-    
-    def filter_table(self):
-        """Filter table based on search text"""
-        search_text = self.search_box.text().lower()
-        
-        for row in range(self.data_table.rowCount()):
-            should_show = False
-            
-            for col in range(self.data_table.columnCount()):
-                item = self.data_table.item(row, col)
-                if item and search_text in item.text().lower():
-                    should_show = True
-                    break
-            
-            self.data_table.setRowHidden(row, not should_show)
     
     def update_chart(self):
         """Update visualization chart"""
+        if self.chart_widget is None:
+            # Drawn when the Visualizations tab is first opened
+            return
+        
+        # Auto-refresh and tab switches often hand back the same summary;
+        # dicts compare by value, so an unchanged chart is not redrawn
+        summary = self.current_dataset.get('summary', {}) if self.current_dataset else None
+        chart_type = self.chart_selector.currentText()
+        chart_key = (chart_type, summary)
+        if chart_key == self.last_chart_key:
+            return
+        self.last_chart_key = chart_key
+        
         if not self.current_dataset:
             # Empty state
-            self.chart_widget.figure.clear()
-            ax = self.chart_widget.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No data available\n\nUpload a CSV file to see visualizations',
-                   ha='center', va='center', fontsize=14, transform=ax.transAxes,
-                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-            ax.axis('off')
-            self.chart_widget.canvas.draw()
+            self.chart_widget.plot_message(
+                'No data available\n\nUpload a CSV file to see visualizations',
+                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+            )
             return
         
-        summary = self.current_dataset.get('summary', {})
-        chart_type = self.chart_selector.currentText()
         type_dist = summary.get('type_distribution', {})
         
         if not type_dist and 'Distribution' in chart_type:
-            self.chart_widget.figure.clear()
-            ax = self.chart_widget.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No equipment type data available',
-                   ha='center', va='center', fontsize=12, transform=ax.transAxes)
-            ax.axis('off')
-            self.chart_widget.canvas.draw()
+            self.chart_widget.plot_message('No equipment type data available', fontsize=12)
             return
         
         if 'Bar' in chart_type and 'Multi' not in chart_type:
@@ -1303,7 +1710,7 @@ class ChemicalEquipmentApp(QMainWindow):
     
     def save_chart(self):
         """Save current chart to file"""
-        if not self.current_dataset:
+        if not self.current_dataset or self.chart_widget is None:
             QMessageBox.warning(self, 'Error', 'No data to save. Please upload a file first.')
             return
         
@@ -1329,6 +1736,18 @@ class ChemicalEquipmentApp(QMainWindow):
     
     def update_history_table(self):
         """Update history table with datasets"""
+        # Suspend painting so the whole table is repainted once at the end,
+        # and sorting so rows don't move while they are being filled
+        self.history_table.setUpdatesEnabled(False)
+        self.history_table.setSortingEnabled(False)
+        try:
+            self._fill_history_rows()
+        finally:
+            self.history_table.setSortingEnabled(True)
+            self.history_table.setUpdatesEnabled(True)
+    
+    def _fill_history_rows(self):
+        """Populate one history row per dataset"""
         self.history_table.setRowCount(len(self.datasets_list))
         
         for row, dataset in enumerate(self.datasets_list):
@@ -1336,68 +1755,21 @@ class ChemicalEquipmentApp(QMainWindow):
             upload_date = dataset.get('uploaded_at', '')
             
             if upload_date:
-                try:
-                    upload_date = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
-                    upload_date = upload_date.strftime('%Y-%m-%d %H:%M')
-                except:
-                    upload_date = 'Unknown'
+                upload_date = format_timestamp(upload_date, 'yyyy-MM-dd HH:mm')
             
-            records = str(dataset.get('total_records', 0))
+            # Integer data rather than text so sorting by Records is numeric
+            records = QTableWidgetItem()
+            records.setData(Qt.EditRole, int(dataset.get('total_records', 0)))
             
             self.history_table.setItem(row, 0, QTableWidgetItem(filename))
             self.history_table.setItem(row, 1, QTableWidgetItem(upload_date))
-            self.history_table.setItem(row, 2, QTableWidgetItem(records))
-            
-            # Action buttons
-            button_layout = QHBoxLayout()
-            button_layout.setContentsMargins(2, 2, 2, 2)
-            button_layout.setSpacing(3)
-            
-            # Load button
-            load_btn = QPushButton('📂 Load')
-            load_btn.setFont(QFont('Arial', 8))
-            load_btn.setMinimumWidth(70)
-            load_btn.setMinimumHeight(32)
-            load_btn.setStyleSheet('''
-                QPushButton {
-                    background-color: #10B981;
-                    color: white;
-                    padding: 4px 8px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #059669;
-                }
-            ''')
-            dataset_id = dataset.get('id')
-            load_btn.clicked.connect(lambda checked, did=dataset_id: self.load_dataset_details(did))
-            button_layout.addWidget(load_btn)
-            
-            # Delete button
-            delete_btn = QPushButton('🗑️ Delete')
-            delete_btn.setFont(QFont('Arial', 8))
-            delete_btn.setMinimumWidth(70)
-            delete_btn.setMinimumHeight(32)
-            delete_btn.setStyleSheet('''
-                QPushButton {
-                    background-color: #EF4444;
-                    color: white;
-                    padding: 4px 8px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #DC2626;
-                }
-            ''')
-            delete_btn.clicked.connect(lambda checked, did=dataset_id: self.delete_dataset(did))
-            button_layout.addWidget(delete_btn)
+            self.history_table.setItem(row, 2, records)
             
-            button_container = QWidget()
-            button_container.setLayout(button_layout)
-            button_container.setMinimumHeight(40)
-            self.history_table.setCellWidget(row, 3, button_container)
+            # Action buttons, painted by ActionButtonDelegate
+            actions = QTableWidgetItem()
+            actions.setFlags(Qt.ItemIsEnabled)
+            actions.setData(Qt.UserRole, dataset.get('id'))
+            self.history_table.setItem(row, 3, actions)
     
     def delete_dataset(self, dataset_id: int):
         """Delete a dataset"""
@@ -1416,7 +1788,7 @@ class ChemicalEquipmentApp(QMainWindow):
             api_url = self.config.get_api_url()
             timeout = self.config.get_api_timeout()
             
-            response = requests.delete(f'{api_url}/datasets/{dataset_id}/', timeout=timeout)
+            response = self.session.delete(f'{api_url}/datasets/{dataset_id}/', timeout=timeout)
             
             if response.status_code in [200, 204]:
                 # Clear upload status
@@ -1451,33 +1823,48 @@ class ChemicalEquipmentApp(QMainWindow):
             QMessageBox.No
         )
         
-        if reply == QMessageBox.No:
+        if reply == QMessageBox.No or self.pending_deletes:
             return
         
-        try:
-            api_url = self.config.get_api_url()
-            timeout = self.config.get_api_timeout()
-            
-            deleted_count = 0
-            for dataset in self.datasets_list:
-                dataset_id = dataset.get('id')
-                response = requests.delete(f'{api_url}/datasets/{dataset_id}/', timeout=timeout)
-                if response.status_code in [200, 204]:
-                    deleted_count += 1
-            
-            self.current_dataset = None
-            self.load_datasets()
-            
-            QMessageBox.information(
-                self,
-                'Success',
-                f'Successfully deleted {deleted_count} dataset(s).'
+        api_url = self.config.get_api_url()
+        timeout = self.config.get_api_timeout()
+        
+        # Deletes run concurrently on the thread pool; the results are tallied
+        # in on_bulk_delete_finished once every request has answered
+        self.pending_deletes = len(self.datasets_list)
+        self.deleted_count = 0
+        self.statusBar().showMessage(f'Deleting {self.pending_deletes} dataset(s)...')
+        
+        for dataset in self.datasets_list:
+            dataset_id = dataset.get('id')
+            task = RequestTask(
+                self.session, 'DELETE', f'{api_url}/datasets/{dataset_id}/',
+                timeout=timeout
             )
-            logger.info(f'Deleted {deleted_count} datasets')
-            
-        except Exception as e:
-            logger.error(f'Error deleting datasets: {e}', exc_info=True)
-            QMessageBox.critical(self, 'Error', f'Failed to delete datasets:\n{str(e)}')
+            task.signals.finished.connect(self.on_bulk_delete_finished)
+            task.signals.error.connect(self.on_bulk_delete_finished)
+            self.thread_pool.start(task)
+    
+    def on_bulk_delete_finished(self, result):
+        """Count one finished delete-all request and report when all are done"""
+        if isinstance(result, requests.Response) and result.status_code in [200, 204]:
+            self.deleted_count += 1
+        else:
+            logger.error(f'Error deleting dataset: {result}')
+        
+        self.pending_deletes -= 1
+        if self.pending_deletes:
+            return
+        
+        self.current_dataset = None
+        self.load_datasets()
+        
+        QMessageBox.information(
+            self,
+            'Success',
+            f'Successfully deleted {self.deleted_count} dataset(s).'
+        )
+        logger.info(f'Deleted {self.deleted_count} datasets')
     
     def download_pdf(self):
         """Download PDF report"""
@@ -1494,41 +1881,48 @@ class ChemicalEquipmentApp(QMainWindow):
             'PDF Files (*.pdf)'
         )
         
-        if filename:
-            try:
-                api_url = self.config.get_api_url()
-                timeout = self.config.get_api_timeout()
-                url = f'{api_url}/datasets/{dataset_id}/generate_pdf/'
-                
-                logger.info(f"Requesting PDF from: {url}")
-                response = requests.get(url, timeout=timeout)
-                
-                if response.status_code == 200:
-                    with open(filename, 'wb') as f:
-                        f.write(response.content)
-                    
-                    QMessageBox.information(
-                        self,
-                        'Success',
-                        f'PDF report saved successfully!\n\n{filename}'
-                    )
-                    self.statusBar().showMessage('✓ PDF downloaded successfully')
-                    logger.info(f'PDF saved: {filename}')
-                else:
-                    error_msg = f"Server returned status {response.status_code}"
-                    logger.error(error_msg)
-                    raise Exception(error_msg)
-                    
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"Connection error: {e}")
-                QMessageBox.critical(
-                    self,
-                    'Connection Error',
-                    f'Cannot connect to server.\n\nPlease ensure the backend is running.'
-                )
-            except Exception as e:
-                logger.error(f'Error downloading PDF: {e}', exc_info=True)
-                QMessageBox.critical(self, 'Error', f'Failed to download PDF:\n\n{str(e)}')
+        if not filename:
+            return
+        
+        api_url = self.config.get_api_url()
+        timeout = self.config.get_api_timeout()
+        url = f'{api_url}/datasets/{dataset_id}/generate_pdf/'
+        
+        logger.info(f"Requesting PDF from: {url}")
+        self.statusBar().showMessage('Downloading PDF...')
+        task = DownloadTask(self.session, url, filename, timeout)
+        task.signals.progress.connect(self.on_pdf_download_progress)
+        task.signals.finished.connect(self.on_pdf_downloaded)
+        task.signals.error.connect(self.on_pdf_download_error)
+        self.thread_pool.start(task)
+    
+    def on_pdf_download_progress(self, percent: int):
+        """Show PDF download progress in the status bar"""
+        self.statusBar().showMessage(f'Downloading PDF... {percent}%')
+    
+    def on_pdf_downloaded(self, filename: str):
+        """Handle a completed PDF download"""
+        QMessageBox.information(
+            self,
+            'Success',
+            f'PDF report saved successfully!\n\n{filename}'
+        )
+        self.statusBar().showMessage('✓ PDF downloaded successfully')
+        logger.info(f'PDF saved: {filename}')
+    
+    def on_pdf_download_error(self, error: Exception):
+        """Handle a failed PDF download"""
+        if isinstance(error, requests.exceptions.ConnectionError):
+            logger.error(f"Connection error: {error}")
+            QMessageBox.critical(
+                self,
+                'Connection Error',
+                f'Cannot connect to server.\n\nPlease ensure the backend is running.'
+            )
+        else:
+            logger.error(f'Error downloading PDF: {error}', exc_info=error)
+            QMessageBox.critical(self, 'Error', f'Failed to download PDF:\n\n{str(error)}')
+        self.statusBar().showMessage('✗ PDF download failed')
     
     def closeEvent(self, event):
         """Handle application close event"""
@@ -1542,6 +1936,9 @@ class ChemicalEquipmentApp(QMainWindow):
         
         if reply == QMessageBox.Yes:
             logger.info('Application closing')
+            self.refresh_timer.stop()
+            self.thread_pool.clear()
+            self.session.close()
             event.accept()
         else:
             event.ignore()